@@ -1,27 +1,26 @@
 import os
-import sys
 import logging
-from typing import List, Dict, Any, Optional
-from pathlib import Path
-from fastapi import FastAPI, UploadFile, File, Form, WebSocket, WebSocketDisconnect, HTTPException, BackgroundTasks
-from fastapi.responses import JSONResponse, FileResponse
+from typing import List, Dict, Any, Optional, Tuple, Set
+from fastapi import FastAPI, UploadFile, File, WebSocket, WebSocketDisconnect, HTTPException, BackgroundTasks, Query
+from fastapi.responses import FileResponse, Response, HTMLResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 import uvicorn
 from starlette.requests import Request
-import json
 import asyncio
 from datetime import datetime
-import shutil
-
-# Ajout du chemin du backend au sys.path
-backend_path = Path(r"C:\Users\ABENGMAH\OneDrive - Deloitte (O365D)\Desktop\Projects\new_workspace\llm_evaluation_system")
-sys.path.append(str(backend_path))
+import msgpack
+import xxhash
+import time
+import functools
+from collections import OrderedDict
+import redis.asyncio as aioredis
 
 # Import du service
 from service import LLMEvaluationService
+from responses import FastORJSONResponse, dumps
 
 # Configuration du logging
 logging.basicConfig(
@@ -30,6 +29,70 @@ logging.basicConfig(
 )
 logger = logging.getLogger("llm_evaluation_api")
 
+# Cache des réponses GET idempotentes (corps déjà sérialisés), LRU borné
+RESPONSE_CACHE_MAX = 256
+_cache_generation = 0
+_response_cache: "OrderedDict[str, Tuple[float, bytes, str]]" = OrderedDict()
+
+def invalidate_response_cache() -> None:
+    global _cache_generation
+    _cache_generation += 1
+    _response_cache.clear()
+
+def _etag(body: bytes) -> str:
+    return f'"{xxhash.xxh3_64_hexdigest(body)}"'
+
+def _conditional_response(request: Request, body: bytes, etag: str) -> Response:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(body, media_type="application/json", headers={"ETag": etag})
+
+def etag_json(request: Request, obj: Any) -> Response:
+    # Réponse conditionnelle pour les ressources individuelles (304 si inchangée)
+    body = dumps(obj)
+    response = _conditional_response(request, body, _etag(body))
+    response.headers["Cache-Control"] = "private, max-age=0"
+    return response
+
+def cached_json(ttl: float):
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            request: Request = kwargs["request"]
+            # Clé limitée aux paramètres déclarés : une chaîne de requête arbitraire
+            # ne crée pas de nouvelle entrée
+            params = sorted((name, value) for name, value in kwargs.items() if name != "request")
+            key = f"{_cache_generation}:{request.url.path}:{params}"
+            now = time.monotonic()
+            entry = _response_cache.get(key)
+            if entry is not None and entry[0] >= now:
+                _response_cache.move_to_end(key)
+            else:
+                _response_cache.pop(key, None)
+                result = await func(*args, **kwargs)
+                response = result if isinstance(result, Response) else FastORJSONResponse(result)
+                if response.status_code != 200:
+                    return response
+                entry = (now + ttl, response.body, _etag(response.body))
+                _response_cache[key] = entry
+                
+                # Purger les entrées expirées, puis les plus anciennes au-delà de la limite
+                for stale_key in [k for k, e in _response_cache.items() if e[0] < now]:
+                    del _response_cache[stale_key]
+                while len(_response_cache) > RESPONSE_CACHE_MAX:
+                    _response_cache.popitem(last=False)
+            return _conditional_response(request, entry[1], entry[2])
+        return wrapper
+    return decorator
+
+# Types MIME des rapports téléchargeables
+REPORT_MEDIA_TYPES = {
+    "html": "text/html",
+    "json": "application/json",
+    "csv": "text/csv"
+}
+
 # Modèles Pydantic mis à jour
 class EvaluationRequest(BaseModel):
     document_ids: List[str]
@@ -37,19 +100,66 @@ class EvaluationRequest(BaseModel):
     selected_criteria: Optional[List[str]] = None
     advanced_criteria: Optional[List[str]] = None
 
+# Préfixe des canaux Redis utilisés pour la diffusion entre workers
+REDIS_CHANNEL_PREFIX = "llmeval:"
+
+# Attente (secondes) avant de se réabonner après une coupure Redis, doublée à chaque échec
+REDIS_RETRY_MIN_DELAY = 1.0
+REDIS_RETRY_MAX_DELAY = 30.0
+
 # Classe pour gérer les WebSockets
 class ConnectionManager:
-    def __init__(self):
-        self.active_connections: Dict[str, List[WebSocket]] = {
-            "qcm_updates": [],
-            "evaluation_status": [],
-            "notifications": []
+    def __init__(self, redis_url: Optional[str] = None):
+        self.active_connections: Dict[str, Set[WebSocket]] = {
+            "qcm_updates": set(),
+            "evaluation_status": set(),
+            "notifications": set()
         }
+        # Sans Redis, la diffusion reste locale au processus
+        self.redis = aioredis.from_url(redis_url) if redis_url else None
+        self._relay_task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        if self.redis is not None:
+            self._relay_task = asyncio.create_task(self._relay())
+
+    async def stop(self):
+        if self._relay_task is not None:
+            self._relay_task.cancel()
+        if self.redis is not None:
+            await self.redis.aclose()
+
+    async def _relay(self):
+        # Relaie les messages publiés par n'importe quel worker vers les clients locaux ;
+        # se réabonne après une coupure Redis et ne s'arrête que sur annulation
+        delay = REDIS_RETRY_MIN_DELAY
+        while True:
+            pubsub = self.redis.pubsub()
+            try:
+                await pubsub.subscribe(*(f"{REDIS_CHANNEL_PREFIX}{channel}" for channel in self.active_connections))
+                delay = REDIS_RETRY_MIN_DELAY
+                async for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+                    try:
+                        channel = message["channel"].decode()[len(REDIS_CHANNEL_PREFIX):]
+                        await self.local_broadcast(message["data"].decode(), channel)
+                    except Exception as e:
+                        logger.warning(f"Error relaying Redis message: {str(e)}")
+            except (aioredis.ConnectionError, aioredis.TimeoutError) as e:
+                logger.error(f"Redis relay disconnected, retrying in {delay:g}s: {str(e)}")
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, REDIS_RETRY_MAX_DELAY)
 
     async def connect(self, websocket: WebSocket, channel: str):
         await websocket.accept()
         if channel in self.active_connections:
-            self.active_connections[channel].append(websocket)
+            self.active_connections[channel].add(websocket)
             logger.info(f"Client connected to {channel} channel")
 
     def disconnect(self, websocket: WebSocket, channel: str):
@@ -61,15 +171,32 @@ class ConnectionManager:
         if channel not in self.active_connections:
             return
         
+        # Sérialiser une seule fois pour tous les clients
+        payload = dumps(message)
+        if self.redis is not None:
+            await self.redis.publish(f"{REDIS_CHANNEL_PREFIX}{channel}", payload)
+        else:
+            await self.local_broadcast(payload.decode(), channel)
+
+    async def local_broadcast(self, payload: str, channel: str):
+        # Envoi en trame texte car le frontend fait JSON.parse(event.data)
+        if channel not in self.active_connections:
+            return
+        
+        connections = list(self.active_connections[channel])
+        # Envoi concurrent : un client lent ne retarde plus les autres
+        results = await asyncio.gather(
+            *(connection.send_text(payload) for connection in connections),
+            return_exceptions=True
+        )
+        
         disconnected = []
-        for connection in self.active_connections[channel]:
-            try:
-                await connection.send_json(message)
-            except WebSocketDisconnect:
+        for connection, result in zip(connections, results):
+            if isinstance(result, WebSocketDisconnect):
                 disconnected.append(connection)
                 logger.info(f"Client disconnected from {channel} channel during broadcast")
-            except Exception as e:
-                logger.warning(f"Error sending WebSocket message: {str(e)}")
+            elif isinstance(result, Exception):
+                logger.warning(f"Error sending WebSocket message: {str(result)}")
                 disconnected.append(connection)
         
         # Nettoyer les connexions déconnectées
@@ -77,7 +204,7 @@ class ConnectionManager:
             self.disconnect(conn, channel)
 
 # Création de l'application FastAPI
-app = FastAPI(title="LLM Evaluation System API", version="1.0.0")
+app = FastAPI(title="LLM Evaluation System API", version="1.0.0", default_response_class=FastORJSONResponse)
 
 # Middleware CORS
 app.add_middleware(
@@ -89,110 +216,115 @@ app.add_middleware(
 )
 
 # Initialisation des services
-manager = ConnectionManager()
-service = LLMEvaluationService()
+manager = ConnectionManager(os.getenv("REDIS_URL"))
+# Les fins d'évaluation et les nouveaux rapports invalident le cache des réponses
+service = LLMEvaluationService(on_change=invalidate_response_cache)
+
+@app.on_event("startup")
+async def start_connection_manager():
+    await manager.start()
+
+@app.on_event("shutdown")
+async def stop_connection_manager():
+    await manager.stop()
+    service.close()
+
+# Gestionnaire global des erreurs non prévues (les 404 explicites restent des HTTPException)
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    logger.error(f"Error handling {request.method} {request.url.path}: {str(exc)}")
+    return FastORJSONResponse({"detail": f"Request to {request.url.path} failed: {str(exc)}"}, status_code=500)
 
 # Configuration des fichiers statiques et templates
 templates = Jinja2Templates(directory="templates")
+# Pages statiques (aucune donnée propre à la requête) : rendues une seule fois au démarrage
+templates.env.auto_reload = False
+page_html = {
+    name: templates.get_template(name).render({"request": None}).encode()
+    for name in ("home.html", "documents.html", "evaluations.html", "reports.html", "llm_panel.html")
+}
+PAGE_HEADERS = {"Cache-Control": "public, max-age=60"}
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
 # Routes pour les pages HTML
 @app.get("/")
-async def read_root(request: Request):
-    return templates.TemplateResponse("home.html", {"request": request})
+async def read_root():
+    return HTMLResponse(page_html["home.html"], headers=PAGE_HEADERS)
 
 @app.get("/documents")
-async def documents_page(request: Request):
-    return templates.TemplateResponse("documents.html", {"request": request})
+async def documents_page():
+    return HTMLResponse(page_html["documents.html"], headers=PAGE_HEADERS)
 
 @app.get("/evaluations")
-async def evaluations_page(request: Request):
-    return templates.TemplateResponse("evaluations.html", {"request": request})
+async def evaluations_page():
+    return HTMLResponse(page_html["evaluations.html"], headers=PAGE_HEADERS)
 
 @app.get("/reports")
-async def reports_page(request: Request):
-    return templates.TemplateResponse("reports.html", {"request": request})
+async def reports_page():
+    return HTMLResponse(page_html["reports.html"], headers=PAGE_HEADERS)
 
 @app.get("/llm-panel")
-async def llm_panel_page(request: Request):
-    return templates.TemplateResponse("llm_panel.html", {"request": request})
+async def llm_panel_page():
+    return HTMLResponse(page_html["llm_panel.html"], headers=PAGE_HEADERS)
 
 # API Routes - Documents
 @app.post("/api/documents/upload")
 async def upload_document(file: UploadFile = File(...)):
-    try:
-        result = await service.upload_document(file)
-        return JSONResponse(content=result)
-    except Exception as e:
-        logger.error(f"Error uploading document: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Failed to upload document: {str(e)}")
+    result = await service.upload_document(file)
+    invalidate_response_cache()
+    return result
 
 @app.get("/api/documents")
-async def get_documents():
-    try:
-        documents = await service.get_documents()
-        return JSONResponse(content={"documents": documents})
-    except Exception as e:
-        logger.error(f"Error getting documents: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Failed to retrieve documents: {str(e)}")
+# TTL court : le cache est propre à chaque worker, et invalidate_response_cache
+# n'atteint pas les autres (l'index du service se resynchronise déjà sur le disque)
+@cached_json(ttl=2)
+async def get_documents(request: Request):
+    documents = await service.get_documents()
+    return FastORJSONResponse({"documents": documents})
 
 @app.get("/api/documents/{document_id}")
-async def get_document(document_id: str):
-    try:
-        document = await service.get_document(document_id)
-        if not document:
-            raise HTTPException(status_code=404, detail=f"Document with ID {document_id} not found")
-        return JSONResponse(content=document)
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error getting document {document_id}: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Failed to retrieve document: {str(e)}")
+async def get_document(document_id: str, request: Request):
+    document = await service.get_document(document_id)
+    if not document:
+        raise HTTPException(status_code=404, detail=f"Document with ID {document_id} not found")
+    return etag_json(request, document)
 
 @app.delete("/api/documents/{document_id}")
 async def delete_document(document_id: str):
-    try:
-        result = await service.delete_document(document_id)
-        if not result.get("success", False):
-            raise HTTPException(status_code=404, detail=f"Document with ID {document_id} not found")
-        return JSONResponse(content=result)
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error deleting document {document_id}: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Failed to delete document: {str(e)}")
+    result = await service.delete_document(document_id)
+    if not result.get("success", False):
+        raise HTTPException(status_code=404, detail=f"Document with ID {document_id} not found")
+    invalidate_response_cache()
+    return result
 
 # API Routes - Évaluations
 @app.post("/api/evaluations/start")
 async def start_evaluation(request: EvaluationRequest, background_tasks: BackgroundTasks):
-    try:
-        evaluation_id = await service.start_evaluation(
-            request.document_ids, 
-            selected_criteria=request.selected_criteria,
-            advanced_criteria=request.advanced_criteria, 
-            test_mode=request.test_mode
-        )
-        
-        # Démarrer l'évaluation en arrière-plan
-        background_tasks.add_task(
-            service.run_evaluation_task, 
-            evaluation_id, 
-            request.document_ids, 
-            request.test_mode, 
-            manager, 
-            request.selected_criteria,
-            request.advanced_criteria
-        )
-        
-        return JSONResponse(content={
-            "evaluation_id": evaluation_id, 
-            "status": "started",
-            "selected_criteria": request.selected_criteria,
-            "advanced_criteria": request.advanced_criteria
-        })
-    except Exception as e:
-        logger.error(f"Error starting evaluation: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Failed to start evaluation: {str(e)}")
+    evaluation_id = await service.start_evaluation(
+        request.document_ids, 
+        selected_criteria=request.selected_criteria,
+        advanced_criteria=request.advanced_criteria, 
+        test_mode=request.test_mode
+    )
+    
+    # Démarrer l'évaluation en arrière-plan
+    background_tasks.add_task(
+        service.run_evaluation_task, 
+        evaluation_id, 
+        request.document_ids, 
+        request.test_mode, 
+        manager, 
+        request.selected_criteria,
+        request.advanced_criteria
+    )
+    invalidate_response_cache()
+    
+    return {
+        "evaluation_id": evaluation_id, 
+        "status": "started",
+        "selected_criteria": request.selected_criteria,
+        "advanced_criteria": request.advanced_criteria
+    }
 
 
 
@@ -200,136 +332,112 @@ async def start_evaluation(request: EvaluationRequest, background_tasks: Backgro
 # Nouvelle route pour obtenir les critères disponibles
 @app.get("/api/criteria")
 async def get_available_criteria():
-    try:
-        criteria = {
-            "available_criteria": [
-                "Bias", 
-                "Integrity", 
-                "Relevance", 
-                "Legal_Compliance", 
-                "Coherence"
-            ],
-            "descriptions": {
-                "Bias": "Évalue la résistance aux biais de genre, culturels et socio-économiques",
-                "Integrity": "Évalue l'exactitude factuelle et la cohérence logique des réponses",
-                "Relevance": "Évalue la pertinence contextuelle et temporelle des réponses",
-                "Legal_Compliance": "Évalue le respect des normes juridiques et réglementaires",
-                "Coherence": "Évalue la structure logique et la cohérence des arguments"
-            }
+    criteria = {
+        "available_criteria": [
+            "Bias", 
+            "Integrity", 
+            "Relevance", 
+            "Legal_Compliance", 
+            "Coherence"
+        ],
+        "descriptions": {
+            "Bias": "Évalue la résistance aux biais de genre, culturels et socio-économiques",
+            "Integrity": "Évalue l'exactitude factuelle et la cohérence logique des réponses",
+            "Relevance": "Évalue la pertinence contextuelle et temporelle des réponses",
+            "Legal_Compliance": "Évalue le respect des normes juridiques et réglementaires",
+            "Coherence": "Évalue la structure logique et la cohérence des arguments"
         }
-        return JSONResponse(content=criteria)
-    except Exception as e:
-        logger.error(f"Error getting criteria: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Failed to retrieve criteria: {str(e)}")
+    }
+    return criteria
 #############
 @app.get("/api/evaluations")
-async def get_evaluations():
-    try:
-        evaluations = await service.get_evaluations()
-        return JSONResponse(content={"evaluations": evaluations})
-    except Exception as e:
-        logger.error(f"Error getting evaluations: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Failed to retrieve evaluations: {str(e)}")
+@cached_json(ttl=2)
+async def get_evaluations(request: Request):
+    evaluations = await service.get_evaluations()
+    return FastORJSONResponse({"evaluations": evaluations})
 
 @app.get("/api/evaluations/{evaluation_id}")
-async def get_evaluation(evaluation_id: str):
-    try:
-        evaluation = await service.get_evaluation(evaluation_id)
-        if not evaluation:
-            raise HTTPException(status_code=404, detail=f"Evaluation with ID {evaluation_id} not found")
-        return JSONResponse(content=evaluation)
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error getting evaluation {evaluation_id}: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Failed to retrieve evaluation: {str(e)}")
+async def get_evaluation(evaluation_id: str, request: Request):
+    evaluation = await service.get_evaluation(evaluation_id)
+    if not evaluation:
+        raise HTTPException(status_code=404, detail=f"Evaluation with ID {evaluation_id} not found")
+    return etag_json(request, evaluation)
 
 @app.get("/api/evaluations/{evaluation_id}/qcm")
-async def get_evaluation_qcm(evaluation_id: str):
-    try:
-        qcm_list = await service.get_evaluation_qcm(evaluation_id)
-        if qcm_list is None:
-            raise HTTPException(status_code=404, detail=f"QCM list for evaluation {evaluation_id} not found")
-        return JSONResponse(content={"qcm_list": qcm_list})
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error getting QCM for evaluation {evaluation_id}: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Failed to retrieve QCM list: {str(e)}")
+async def get_evaluation_qcm(evaluation_id: str, request: Request):
+    qcm_list = await service.get_evaluation_qcm(evaluation_id)
+    if qcm_list is None:
+        raise HTTPException(status_code=404, detail=f"QCM list for evaluation {evaluation_id} not found")
+    # Encodage binaire MessagePack pour les clients qui le demandent, JSON par défaut
+    if "application/x-msgpack" in request.headers.get("accept", ""):
+        return Response(
+            msgpack.packb({"qcm_list": qcm_list}, use_bin_type=True),
+            media_type="application/x-msgpack"
+        )
+    return FastORJSONResponse({"qcm_list": qcm_list})
 
 # API Routes - Rapports
 @app.get("/api/reports")
-async def get_reports():
-    try:
-        reports = await service.get_reports()
-        return JSONResponse(content={"reports": reports})
-    except Exception as e:
-        logger.error(f"Error getting reports: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Failed to retrieve reports: {str(e)}")
+@cached_json(ttl=5)
+async def get_reports(request: Request):
+    reports = await service.get_reports()
+    return {"reports": reports}
 
 @app.get("/api/reports/filter")
 async def filter_reports(evaluation_id: Optional[str] = None, document_id: Optional[str] = None, 
-                         date_from: Optional[str] = None, date_to: Optional[str] = None):
-    try:
-        reports = await service.get_reports(evaluation_id, document_id, date_from, date_to)
-        return JSONResponse(content={"reports": reports})
-    except Exception as e:
-        logger.error(f"Error filtering reports: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Failed to filter reports: {str(e)}")
+                         date_from: Optional[str] = None, date_to: Optional[str] = None,
+                         limit: Optional[int] = Query(None, ge=1)):
+    # Rejeter les dates invalides avant de parcourir les rapports
+    for name, value in (("date_from", date_from), ("date_to", date_to)):
+        if value:
+            try:
+                datetime.fromisoformat(value)
+            except ValueError:
+                raise HTTPException(status_code=400, detail=f"Invalid {name}: expected ISO 8601 date, got {value}")
+    reports = await service.get_reports(evaluation_id, document_id, date_from, date_to, limit)
+    return FastORJSONResponse({"reports": reports})
 
 @app.get("/api/reports/{report_id}")
-async def get_report(report_id: str):
-    try:
-        report = await service.get_report(report_id)
-        if not report:
-            raise HTTPException(status_code=404, detail=f"Report with ID {report_id} not found")
-        return JSONResponse(content=report)
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error getting report {report_id}: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Failed to retrieve report: {str(e)}")
+async def get_report(report_id: str, request: Request, content: bool = True):
+    report = await service.get_report(report_id, load_content=content)
+    if not report:
+        raise HTTPException(status_code=404, detail=f"Report with ID {report_id} not found")
+    return etag_json(request, report)
 
 @app.get("/api/reports/download/{report_id}")
 async def download_report(report_id: str, format: str = "html"):
-    try:
-        report_path = await service.download_report(report_id, format)
-        if not report_path:
-            raise HTTPException(status_code=404, detail=f"Report with ID {report_id} not found or format {format} not available")
-            
-        # Créer un nom de fichier propre pour le téléchargement
-        report = await service.get_report(report_id)
-        evaluation_id = report.get("evaluation_id", "unknown")
-        date_str = datetime.now().strftime("%Y%m%d")
-        
-        filename = f"LLM_Evaluation_Report_{evaluation_id}_{date_str}.{format}"
+    download = await service.download_report(report_id, format)
+    if not download:
+        raise HTTPException(status_code=404, detail=f"Report with ID {report_id} not found or format {format} not available")
+    report_path, report, stat_result = download
         
-        return FileResponse(path=report_path, filename=filename)
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error downloading report {report_id}: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Failed to download report: {str(e)}")
+    # Créer un nom de fichier propre pour le téléchargement
+    evaluation_id = report.get("evaluation_id", "unknown")
+    date_str = datetime.now().strftime("%Y%m%d")
+    
+    filename = f"LLM_Evaluation_Report_{evaluation_id}_{date_str}.{format}"
+    
+    # stat_result déjà pris par le service hors de la boucle d'événements
+    return FileResponse(
+        path=report_path,
+        filename=filename,
+        media_type=REPORT_MEDIA_TYPES.get(format),
+        stat_result=stat_result
+    )
     
 
 # API Routes - LLM
 @app.get("/api/llm/info")
-async def get_llm_info():
-    try:
-        llm_info = await service.get_llm_info()
-        return JSONResponse(content=llm_info)
-    except Exception as e:
-        logger.error(f"Error getting LLM info: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Failed to retrieve LLM info: {str(e)}")
+@cached_json(ttl=3600)
+async def get_llm_info(request: Request):
+    llm_info = await service.get_llm_info()
+    return llm_info
 
 @app.get("/api/llm/statistics")
-async def get_llm_statistics():
-    try:
-        llm_stats = await service.get_llm_statistics()
-        return JSONResponse(content=llm_stats)
-    except Exception as e:
-        logger.error(f"Error getting LLM statistics: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Failed to retrieve LLM statistics: {str(e)}")
+@cached_json(ttl=10)
+async def get_llm_statistics(request: Request):
+    llm_stats = await service.get_llm_statistics()
+    return llm_stats
 
 # WebSocket routes
 @app.websocket("/ws/qcm-updates")
@@ -337,8 +445,8 @@ async def websocket_qcm_updates(websocket: WebSocket):
     await manager.connect(websocket, "qcm_updates")
     try:
         while True:
-            # Keep the connection open
-            await asyncio.sleep(10)
+            # Attendre les messages du client (la tâche reste suspendue sur le socket)
+            await websocket.receive_text()
     except WebSocketDisconnect:
         manager.disconnect(websocket, "qcm_updates")
 
@@ -347,8 +455,8 @@ async def websocket_evaluation_status(websocket: WebSocket):
     await manager.connect(websocket, "evaluation_status")
     try:
         while True:
-            # Keep the connection open
-            await asyncio.sleep(10)
+            # Attendre les messages du client (la tâche reste suspendue sur le socket)
+            await websocket.receive_text()
     except WebSocketDisconnect:
         manager.disconnect(websocket, "evaluation_status")
 
@@ -357,8 +465,8 @@ async def websocket_notifications(websocket: WebSocket):
     await manager.connect(websocket, "notifications")
     try:
         while True:
-            # Keep the connection open
-            await asyncio.sleep(10)
+            # Attendre les messages du client (la tâche reste suspendue sur le socket)
+            await websocket.receive_text()
     except WebSocketDisconnect:
         manager.disconnect(websocket, "notifications")
 
@@ -369,15 +477,38 @@ async def websocket_progress_updates(websocket: WebSocket):
     await manager.connect(websocket, "progress_updates")
     try:
         while True:
-            await asyncio.sleep(10)
+            await websocket.receive_text()
     except WebSocketDisconnect:
         manager.disconnect(websocket, "progress_updates")
 
 # Route pour la santé de l'API
+# Horodatage mis en cache pendant une seconde (précision suffisante pour un healthcheck)
+_health_timestamp = [0.0, ""]
+
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "timestamp": datetime.now().isoformat()}
+    now = time.time()
+    if now - _health_timestamp[0] > 1.0:
+        _health_timestamp[:] = [now, datetime.fromtimestamp(now).isoformat()]
+    return {"status": "healthy", "timestamp": _health_timestamp[1]}
 
 # Exécution de l'application
 if __name__ == "__main__":
-    uvicorn.run("api:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+    # API_WORKERS > 1 en production (un processus par cœur, rechargement désactivé) ;
+    # définir REDIS_URL pour que les diffusions WebSocket atteignent tous les workers
+    workers = int(os.getenv("API_WORKERS", "1"))
+    uvicorn.run(
+        "api:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=workers == 1,
+        workers=workers,
+        limit_concurrency=1000,
+        backlog=2048,
+        timeout_keep_alive=30,
+        # uvloop / httptools quand ils sont installés (absents sous Windows), sinon asyncio / h11
+        loop="auto",
+        http="auto",
+        ws="websockets",
+        proxy_headers=False
+    )
\ No newline at end of file
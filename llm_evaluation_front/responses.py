@@ -0,0 +1,28 @@
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+import orjson
+from fastapi.responses import Response
+
+
+def orjson_default(obj: Any) -> Any:
+    # orjson gère nativement datetime et UUID ; on complète les types restants
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, Path):
+        return str(obj)
+    raise TypeError(f"Type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any) -> bytes:
+    return orjson.dumps(obj, default=orjson_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+
+class FastORJSONResponse(Response):
+    """Réponse JSON sérialisée en un seul passage par orjson"""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
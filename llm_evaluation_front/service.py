@@ -3,19 +3,41 @@ import sys
 import logging
 import asyncio
 import uuid
-import json
 import time
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Iterator, Optional, Set, Tuple, Union
+from collections import OrderedDict
+import bisect
+import hashlib
+import heapq
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from pathlib import Path
+from types import MappingProxyType
 from datetime import datetime
-import shutil
 from fastapi import UploadFile
+import aiofiles
+import numpy as np
+from jinja2 import Environment, FileSystemLoader
+import orjson
+
+# Verrou inter-processus du manifeste des rapports (absent sous Windows, où un seul
+# worker est supporté)
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
 import asyncio
 from typing import List, Dict, Any
 
-# Ajout du chemin du backend au sys.path
-backend_path = Path(r"C:\Users\ABENGMAH\OneDrive - Deloitte (O365D)\Desktop\Projects\new_workspace\llm_evaluation_system")
-sys.path.append(str(backend_path))
+# Ajout du chemin du backend au sys.path (dossier voisin par défaut,
+# surchargeable via LLM_EVALUATION_SYSTEM_PATH)
+backend_path = Path(os.getenv(
+    "LLM_EVALUATION_SYSTEM_PATH",
+    Path(__file__).resolve().parent.parent / "llm_evaluation_system"
+))
+if str(backend_path) not in sys.path:
+    sys.path.append(str(backend_path))
 
 # Import du système d'évaluation
 from main import LLMEvaluationSystem
@@ -29,12 +51,104 @@ logging.basicConfig(
 )
 logger = logging.getLogger("llm_evaluation_service")
 
+# Gabarit HTML des rapports, compilé une seule fois au chargement du module
+REPORT_HTML_TEMPLATE = Environment(
+    loader=FileSystemLoader(Path(__file__).resolve().parent / "templates"),
+    autoescape=True
+).get_template("report_export.html")
+
+
+def _json_dumps(data: Any, pretty: bool = False) -> bytes:
+    """Sérialise en JSON (UTF-8) via orjson"""
+    option = orjson.OPT_NON_STR_KEYS
+    if pretty:
+        option |= orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+    return orjson.dumps(data, default=str, option=option)
+
+
+def _json_loads(data: Union[bytes, str]) -> Any:
+    """Désérialise du JSON via orjson"""
+    return orjson.loads(data)
+
+
+# Taille des blocs lus lors de l'upload (1 Mo)
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Nombre maximal de fichiers de métadonnées gardés en cache
+META_CACHE_MAX = 4096
+
+# Intervalle (secondes) entre deux resynchronisations de l'index des documents avec le disque
+DOCUMENTS_CHECK_INTERVAL = 30.0
+
+# Regroupement des QCM diffusés en temps réel (nombre max par message / délai max en secondes)
+QCM_BATCH_SIZE = 5
+QCM_BATCH_INTERVAL = 0.25
+
+# Délai (secondes) entre deux écritures différées des métadonnées d'évaluation
+EVAL_FLUSH_INTERVAL = 1.0
+
+# Fenêtre (secondes) de regroupement des écritures de métadonnées
+WRITE_COALESCE_DELAY = 0.025
+
+# Nombre maximal d'évaluations exécutées simultanément
+MAX_CONCURRENT_EVALS = int(os.getenv("MAX_CONCURRENT_EVALS", "2"))
+
+# Taille du pool de threads dédié aux accès fichiers
+IO_POOL_WORKERS = int(os.getenv("IO_POOL_WORKERS", "16"))
+
+# Champs d'une évaluation exposés et persistés (sans qcm_list ni chemins serveur)
+_EVAL_SUMMARY_KEYS = (
+    "id", "documents", "test_mode", "selected_criteria", "advanced_criteria",
+    "status", "progress", "start_time", "end_time", "total_qcm", "completed_qcm",
+    "qcm_count", "error", "report_paths", "results"
+)
+
+# Formats de rapport disponibles
+REPORT_FORMATS = ("html", "json", "csv")
+
+def _read_report_text(file_path: str) -> str:
+    return Path(file_path).read_text(encoding="utf-8")
+
+
+def _read_report_json(file_path: str) -> Any:
+    return _json_loads(Path(file_path).read_bytes())
+
+
+# Chargement du contenu des rapports par format : clé de report_info -> fonction de lecture
+_REPORT_LOADERS = {
+    "html": ("content", _read_report_text),
+    "json": ("data", _read_report_json),
+}
+
+# Critères agrégés par get_llm_statistics, et leur colonne dans le tableau des scores
+# (colonnes 0 et 1 : score global et taux de succès)
+STATS_CRITERIA = ("Bias", "Integrity", "Relevance", "Legal_Compliance", "Coherence")
+_CRITERIA_COLUMNS = {criterion: col for col, criterion in enumerate(STATS_CRITERIA, start=2)}
+
+# Informations statiques sur le LLM, construites une seule fois
+# (ces informations seraient normalement extraites du backend)
+_LLM_INFO = MappingProxyType({
+    "model": "Gemini Pro",
+    "version": "2.0-flash",
+    "role": "Assistant Juridique",
+    "temperature": 0,
+    "max_tokens": 2048,
+    "description": "Modèle de langage optimisé pour l'évaluation des connaissances juridiques"
+})
+
 class LLMEvaluationService:
     """Service d'interface entre l'API et le système d'évaluation LLM"""
     
-    def __init__(self):
-        """Initialise le service avec le système d'évaluation LLM"""
+    def __init__(self, on_change: Optional[Callable[[], None]] = None):
+        """
+        Initialise le service avec le système d'évaluation LLM
+        
+        Args:
+            on_change: Appelé après chaque écriture de métadonnées d'évaluation ou du
+                manifeste des rapports (ex: invalidation du cache des réponses de l'API)
+        """
         self.evaluation_system = LLMEvaluationSystem()
+        self._on_change = on_change
         self.documents_dir = INPUT_DIR
         self.output_dir = OUTPUT_DIR
         
@@ -42,6 +156,39 @@ class LLMEvaluationService:
         self.evaluations = {}
         self.qcm_cache = {}
         
+        # Cache LRU des métadonnées JSON : chemin -> (mtime_ns, taille, données)
+        self._meta_cache: OrderedDict = OrderedDict()
+        
+        # Index en mémoire des documents, trié par date d'upload (clé: (upload_date, id))
+        self._documents_index: Dict[str, Dict[str, Any]] = {}
+        self._documents_order: List[Tuple[str, str]] = []
+        self._documents_checked_at = 0.0
+        self._documents_dirs_version: Optional[Tuple[int, int]] = None
+        
+        # Empreinte SHA-256 du contenu -> ID du document, pour dédupliquer les uploads
+        self._hash_index: Dict[str, str] = {}
+        
+        # Évaluations modifiées en attente d'écriture sur disque
+        self._dirty_evals: Set[str] = set()
+        self._flush_task: Optional[asyncio.Task] = None
+        
+        # Écritures de métadonnées en attente, regroupées par lot : chemin -> contenu
+        self._pending_writes: Dict[Path, bytes] = {}
+        self._pending_waiters: Dict[Path, List[asyncio.Future]] = {}
+        self._writer_task: Optional[asyncio.Task] = None
+        
+        # Limite le nombre d'évaluations simultanées (créé dans la boucle d'événements)
+        self._eval_sem: Optional[asyncio.Semaphore] = None
+        
+        # Pool dédié aux accès fichiers, séparé du pool par défaut utilisé par les appels au backend
+        self._io_pool = ThreadPoolExecutor(max_workers=IO_POOL_WORKERS, thread_name_prefix="svc-io")
+        
+        # Rapports en cours de génération à la demande : chemin -> tâche
+        self._report_renders: Dict[str, asyncio.Task] = {}
+        
+        # Dernières statistiques calculées, avec l'empreinte des évaluations utilisées
+        self._stats_cache: Optional[Tuple[frozenset, Dict[str, Any]]] = None
+        
         # Créer les répertoires nécessaires
         Path(self.documents_dir).mkdir(parents=True, exist_ok=True)
         Path(self.output_dir).mkdir(parents=True, exist_ok=True)
@@ -50,10 +197,29 @@ class LLMEvaluationService:
         self.frontend_data_dir = Path("static/data")
         self.frontend_data_dir.mkdir(parents=True, exist_ok=True)
         
+        # Métadonnées des documents dans leur propre répertoire : sa date de modification
+        # ne change qu'avec les documents, pas à chaque écriture d'évaluation ou de rapport
+        self.documents_meta_dir = self.frontend_data_dir / "documents"
+        self.documents_meta_dir.mkdir(exist_ok=True)
+        self._migrate_documents_meta()
+        
+        # Modèles des chemins de métadonnées (un str.format par appel, sans objet Path)
+        data_dir = str(self.frontend_data_dir)
+        self._document_meta_fmt = os.path.join(str(self.documents_meta_dir), "document_{}.json")
+        self._evaluation_meta_fmt = os.path.join(data_dir, "evaluation_{}.json")
+        self._report_meta_fmt = os.path.join(data_dir, "report_{}.json")
+        
         # Répertoire pour les rapports
         self.frontend_reports_dir = Path("static/reports")
         self.frontend_reports_dir.mkdir(parents=True, exist_ok=True)
         
+        # Manifeste des rapports (champs filtrables), chargé à la demande
+        self.reports_index_path = self.frontend_data_dir / "reports_index.json"
+        self._reports_index: Optional[List[Dict[str, Any]]] = None
+        self._reports_index_version: Optional[Tuple[int, int, int]] = None
+        self._reports_index_lock: Optional[asyncio.Lock] = None
+        self._reports_index_lock_path = self.frontend_data_dir / "reports_index.lock"
+        
         logger.info("LLM Evaluation Service initialized successfully")
 
     async def upload_document(self, file: UploadFile) -> Dict[str, Any]:
@@ -78,32 +244,67 @@ class LLMEvaluationService:
             # Créer le chemin de destination
             dest_path = Path(self.documents_dir) / f"{doc_id}{file_ext}"
             
-            # Copier le fichier vers le dossier d'entrée
-            with open(dest_path, "wb") as buffer:
-                content = await file.read()
-                buffer.write(content)
-            
-            # Préparer les métadonnées du document
-            doc_info = {
-                "id": doc_id,
-                "original_name": file.filename,
-                "path": str(dest_path),
-                "size": len(content),
-                "upload_date": datetime.now().isoformat(),
-                "status": "available"  # Mettre status à "available" immédiatement
-            }
-            
-            # Sauvegarder les métadonnées du document
-            doc_meta_path = self.frontend_data_dir / f"document_{doc_id}.json"
-            await self._save_json_file(doc_meta_path, doc_info)
-            
-            logger.info(f"Document uploaded successfully: {doc_id}")
-            return doc_info
+            # Copier le fichier vers le dossier d'entrée par blocs,
+            # sans charger l'upload entier en mémoire, en calculant son empreinte au passage
+            size = 0
+            digest = hashlib.sha256()
+            async with aiofiles.open(dest_path, "wb") as buffer:
+                while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                    digest.update(chunk)
+                    await buffer.write(chunk)
+                    size += len(chunk)
+            content_hash = digest.hexdigest()
+            
+            # Contenu déjà présent : réutiliser le document existant
+            await self._ensure_documents_index_fresh()
+            existing_id = self._hash_index.get(content_hash)
+            existing = self._documents_index.get(existing_id) if existing_id else None
+            if existing and existing.get("status") == "available":
+                await self._to_io(os.remove, dest_path)
+                logger.info(f"Duplicate upload of document {existing_id}, reusing it")
+                return {**existing, "duplicate": True}
+            
+            return await self.register_document(doc_id, dest_path, file.filename, size, content_hash)
             
         except Exception as e:
             logger.error(f"Error uploading document: {str(e)}")
             raise
     
+    async def register_document(self, doc_id: str, path: Path, original_name: str, size: int,
+                                content_hash: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Enregistre les métadonnées d'un document déjà écrit sur disque
+        
+        Args:
+            doc_id: ID du document
+            path: Chemin du fichier dans le répertoire d'entrée
+            original_name: Nom du fichier uploadé
+            size: Taille du fichier en octets
+            content_hash: Empreinte SHA-256 du contenu (optionnel)
+            
+        Returns:
+            Dict[str, Any]: Informations sur le document chargé
+        """
+        # Préparer les métadonnées du document
+        doc_info = {
+            "id": doc_id,
+            "original_name": original_name,
+            "path": str(path),
+            "size": size,
+            "upload_date": datetime.now().isoformat(),
+            "status": "available"  # Mettre status à "available" immédiatement
+        }
+        if content_hash:
+            doc_info["hash"] = content_hash
+        
+        # Sauvegarder les métadonnées du document
+        doc_meta_path = self._document_meta_fmt.format(doc_id)
+        await self._save_json_file(doc_meta_path, doc_info)
+        self._index_document(dict(doc_info))
+        
+        logger.info(f"Document uploaded successfully: {doc_id}")
+        return doc_info
+    
     async def get_documents(self) -> List[Dict[str, Any]]:
         """
         Récupère la liste des documents disponibles
@@ -112,36 +313,130 @@ class LLMEvaluationService:
             List[Dict[str, Any]]: Liste des documents avec leurs métadonnées
         """
         try:
-            documents = []
-            
-            # Chercher tous les fichiers de métadonnées de documents
-            meta_files = list(self.frontend_data_dir.glob("document_*.json"))
-            
-            for meta_file in meta_files:
-                try:
-                    with open(meta_file, "r", encoding="utf-8") as f:
-                        doc_info = json.load(f)
-                    
-                    # Vérifier si le fichier existe toujours
-                    if os.path.exists(doc_info["path"]):
-                        documents.append(doc_info)
-                    else:
-                        # Mettre à jour le statut si le fichier n'existe plus
-                        doc_info["status"] = "missing"
-                        documents.append(doc_info)
-                        await self._save_json_file(meta_file, doc_info)
-                except Exception as e:
-                    logger.error(f"Error reading document metadata {meta_file}: {str(e)}")
-            
-            # Trier les documents par date d'upload (du plus récent au plus ancien)
-            documents.sort(key=lambda x: x["upload_date"], reverse=True)
+            await self._ensure_documents_index_fresh()
             
-            return documents
+            # Du plus récent au plus ancien
+            return [dict(self._documents_index[doc_id]) for _, doc_id in reversed(self._documents_order)]
             
         except Exception as e:
             logger.error(f"Error getting documents: {str(e)}")
             raise
     
+    def _documents_version(self) -> Tuple[int, int]:
+        """
+        Dates de modification des répertoires des métadonnées de documents et des documents :
+        elles changent à chaque fichier créé, remplacé ou supprimé, y compris par un autre worker
+        
+        Returns:
+            Tuple[int, int]: st_mtime_ns des deux répertoires
+        """
+        return (
+            os.stat(self.documents_meta_dir).st_mtime_ns,
+            os.stat(self.documents_dir).st_mtime_ns
+        )
+    
+    def _migrate_documents_meta(self) -> None:
+        """
+        Déplace les métadonnées de documents de l'ancien emplacement (static/data)
+        vers leur répertoire dédié
+        """
+        for entry in self._scan_meta_files("document_"):
+            os.replace(entry.path, self.documents_meta_dir / entry.name)
+    
+    async def _ensure_documents_index_fresh(self) -> None:
+        """
+        Resynchronise l'index des documents avec le disque si l'un des répertoires
+        a changé, et au moins une fois par intervalle
+        """
+        version = await self._to_io(self._documents_version)
+        if (version != self._documents_dirs_version
+                or time.monotonic() - self._documents_checked_at > DOCUMENTS_CHECK_INTERVAL):
+            # Empreinte prise avant le parcours : un changement pendant celui-ci sera revu
+            self._documents_dirs_version = version
+            await self._refresh_documents_index()
+    
+    async def _refresh_documents_index(self) -> None:
+        """
+        Reconstruit l'index des documents à partir des fichiers de métadonnées
+        et met à jour le statut des documents dont le fichier a disparu
+        """
+        documents = []
+        
+        # Chercher tous les fichiers de métadonnées de documents
+        meta_files = self._scan_meta_files("document_", self.documents_meta_dir)
+        
+        # Lire toutes les métadonnées en parallèle, hors de la boucle d'événements
+        infos = await asyncio.gather(
+            *(self._read_meta_cached(entry) for entry in meta_files),
+            return_exceptions=True
+        )
+        
+        # Résultats des vérifications d'existence pour ce parcours
+        exists_cache: Dict[str, bool] = {}
+        # Documents passés de disponible à manquant, à réécrire sur disque
+        newly_missing = []
+        
+        for meta_file, doc_info in zip(meta_files, infos):
+            if isinstance(doc_info, Exception):
+                logger.error(f"Error reading document metadata {meta_file.path}: {str(doc_info)}")
+                continue
+            
+            # Vérifier si le fichier existe toujours
+            doc_path = doc_info["path"]
+            if doc_path not in exists_cache:
+                exists_cache[doc_path] = os.path.exists(doc_path)
+            if not exists_cache[doc_path] and doc_info.get("status") != "missing":
+                # Mettre à jour le statut seulement au changement
+                doc_info["status"] = "missing"
+                newly_missing.append((meta_file.path, doc_info))
+            documents.append(doc_info)
+        
+        saved = await asyncio.gather(
+            *(self._save_json_file(path, doc_info) for path, doc_info in newly_missing),
+            return_exceptions=True
+        )
+        for (path, _), result in zip(newly_missing, saved):
+            if isinstance(result, Exception):
+                logger.error(f"Error updating document metadata {path}: {str(result)}")
+        
+        self._documents_index = {}
+        self._documents_order = []
+        self._hash_index = {}
+        for doc_info in documents:
+            self._index_document(doc_info)
+        self._documents_checked_at = time.monotonic()
+    
+    def _index_document(self, doc_info: Dict[str, Any]) -> None:
+        """
+        Ajoute un document à l'index en mémoire en conservant l'ordre par date
+        
+        Args:
+            doc_info: Métadonnées du document
+        """
+        if doc_info["id"] in self._documents_index:
+            self._unindex_document(doc_info["id"])
+        self._documents_index[doc_info["id"]] = doc_info
+        bisect.insort(self._documents_order, (doc_info["upload_date"], doc_info["id"]))
+        if doc_info.get("hash"):
+            self._hash_index[doc_info["hash"]] = doc_info["id"]
+    
+    def _unindex_document(self, document_id: str) -> None:
+        """
+        Retire un document de l'index en mémoire
+        
+        Args:
+            document_id: ID du document
+        """
+        doc_info = self._documents_index.pop(document_id, None)
+        if doc_info is None:
+            return
+        if self._hash_index.get(doc_info.get("hash")) == document_id:
+            del self._hash_index[doc_info["hash"]]
+        key = (doc_info["upload_date"], document_id)
+        idx = bisect.bisect_left(self._documents_order, key)
+        if idx < len(self._documents_order) and self._documents_order[idx] == key:
+            del self._documents_order[idx]
+    
     async def get_document(self, document_id: str) -> Optional[Dict[str, Any]]:
         """
         Récupère les informations d'un document spécifique
@@ -153,14 +448,13 @@ class LLMEvaluationService:
             Optional[Dict[str, Any]]: Informations sur le document ou None s'il n'existe pas
         """
         try:
-            meta_path = self.frontend_data_dir / f"document_{document_id}.json"
+            meta_path = self._document_meta_fmt.format(document_id)
             
-            if not meta_path.exists():
+            try:
+                doc_info = await self._read_meta_cached(meta_path)
+            except FileNotFoundError:
                 return None
                 
-            with open(meta_path, "r", encoding="utf-8") as f:
-                doc_info = json.load(f)
-                
             # Vérifier si le fichier existe toujours
             if os.path.exists(doc_info["path"]):
                 doc_info["status"] = "available"
@@ -184,21 +478,22 @@ class LLMEvaluationService:
             Dict[str, Any]: Résultat de l'opération
         """
         try:
-            meta_path = self.frontend_data_dir / f"document_{document_id}.json"
+            meta_path = self._document_meta_fmt.format(document_id)
             
-            if not meta_path.exists():
+            if not os.path.exists(meta_path):
                 return {"success": False, "error": "Document not found"}
                 
             # Charger les métadonnées
-            with open(meta_path, "r", encoding="utf-8") as f:
-                doc_info = json.load(f)
+            doc_info = await self._read_meta_cached(meta_path)
                 
             # Supprimer le fichier s'il existe
             if os.path.exists(doc_info["path"]):
-                os.remove(doc_info["path"])
+                await self._to_io(os.remove, doc_info["path"])
                 
             # Supprimer le fichier de métadonnées
-            os.remove(meta_path)
+            await self._to_io(os.remove, meta_path)
+            self._meta_cache.pop(str(meta_path), None)
+            self._unindex_document(document_id)
             
             return {"success": True, "message": f"Document {document_id} deleted successfully"}
             
@@ -226,12 +521,12 @@ class LLMEvaluationService:
             # Générer un ID unique pour l'évaluation
             evaluation_id = str(uuid.uuid4())
             
-            # Récupérer les chemins des documents
-            documents = []
-            for doc_id in document_ids:
-                doc_info = await self.get_document(doc_id)
-                if doc_info and doc_info["status"] == "available":
-                    documents.append(doc_info["path"])
+            # Récupérer les chemins des documents (lectures en parallèle)
+            doc_infos = await asyncio.gather(*(self.get_document(doc_id) for doc_id in document_ids))
+            documents = [
+                doc_info["path"] for doc_info in doc_infos
+                if doc_info and doc_info["status"] == "available"
+            ]
             
             if not documents:
                 raise ValueError("No valid documents found for evaluation")
@@ -249,8 +544,7 @@ class LLMEvaluationService:
                 "start_time": datetime.now().isoformat(),
                 "end_time": None,
                 "total_qcm": 0,
-                "completed_qcm": 0,
-                "qcm_list": []
+                "completed_qcm": 0
             }
             
             # Sauvegarder les métadonnées de l'évaluation
@@ -274,7 +568,23 @@ class LLMEvaluationService:
                            test_mode: bool, manager, selected_criteria: List[str] = None,
                            advanced_criteria: List[str] = None) -> None:
         """
-        Exécute l'évaluation en arrière-plan et met à jour le statut
+        Exécute l'évaluation en arrière-plan et met à jour le statut.
+        Les évaluations au-delà de MAX_CONCURRENT_EVALS restent en attente ("pending").
+        """
+        if self._eval_sem is None:
+            self._eval_sem = asyncio.Semaphore(MAX_CONCURRENT_EVALS)
+        
+        async with self._eval_sem:
+            await self._run_evaluation_task(
+                evaluation_id, document_ids, test_mode, manager,
+                selected_criteria, advanced_criteria
+            )
+    
+    async def _run_evaluation_task(self, evaluation_id: str, document_ids: List[str], 
+                            test_mode: bool, manager, selected_criteria: List[str] = None,
+                            advanced_criteria: List[str] = None) -> None:
+        """
+        Déroule les étapes de l'évaluation (documents, QCM, évaluation, rapports)
         """
         try:
             # Mettre à jour le statut
@@ -286,17 +596,17 @@ class LLMEvaluationService:
             # Récupérer les chemins des documents
             document_paths = self.evaluations[evaluation_id]["document_paths"]
             
-            # Traiter les documents
-            chunks = self.evaluation_system.process_documents(document_paths)
-            
-            # Cédez régulièrement le contrôle pour permettre la navigation
-            await asyncio.sleep(0.1)
-            
-            # Générer et stocker les embeddings
-            self.evaluation_system.generate_and_store_embeddings(chunks)
+            # Traiter les documents hors de la boucle d'événements
+            chunks = await asyncio.to_thread(
+                self.evaluation_system.process_documents,
+                document_paths
+            )
             
-            # Cédez régulièrement le contrôle pour permettre la navigation
-            await asyncio.sleep(0.1)
+            # Générer et stocker les embeddings hors de la boucle d'événements
+            await asyncio.to_thread(
+                self.evaluation_system.generate_and_store_embeddings,
+                chunks
+            )
             
             # Générer les QCM avec les critères sélectionnés
             qcm_list = await self._generate_qcm_with_updates(
@@ -331,7 +641,8 @@ class LLMEvaluationService:
            
             
             # Générer les rapports
-            report_paths = await self.generate_reports(evaluation_id, evaluation_results)
+            # Seul le JSON est écrit immédiatement ; HTML et CSV sont générés au premier téléchargement
+            report_paths = await self.generate_reports(evaluation_id, evaluation_results, formats=("json",))
             
             # Mettre à jour le statut final
             self.evaluations[evaluation_id]["status"] = "completed"
@@ -377,38 +688,42 @@ class LLMEvaluationService:
                 except Exception as ex:
                     logger.warning(f"Non-critical: Error broadcasting error message: {str(ex)}")
     
-    async def _update_evaluation_status(self, evaluation_id: str, manager) -> None:
+    async def _update_evaluation_status(self, evaluation_id: str, manager,
+                                        timestamp: Optional[str] = None) -> None:
         """
         Met à jour le statut de l'évaluation via WebSocket
+        
+        Args:
+            evaluation_id: ID de l'évaluation
+            manager: Gestionnaire de connexions WebSocket
+            timestamp: Horodatage ISO déjà calculé par l'appelant (sinon l'heure courante)
         """
         if evaluation_id in self.evaluations:
             eval_info = self.evaluations[evaluation_id]
+            if timestamp is None:
+                timestamp = datetime.now().isoformat()
             
-            # Mise à jour standard
-            status_update = {
-                "type": "evaluation_status",
+            # Champs communs aux deux messages, lus une seule fois
+            progress_fields = {
                 "evaluation_id": evaluation_id,
-                "status": eval_info["status"],
                 "progress": eval_info["progress"],
                 "total_qcm": eval_info["total_qcm"],
                 "completed_qcm": eval_info["completed_qcm"],
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
             
+            # Mise à jour standard
+            status_update = {"type": "evaluation_status", "status": eval_info["status"], **progress_fields}
+            
             # Mise à jour détaillée de la progression
-            progress_update = {
-                "type": "progress_update",
-                "evaluation_id": evaluation_id,
-                "progress": eval_info["progress"],
-                "total_qcm": eval_info["total_qcm"],
-                "completed_qcm": eval_info["completed_qcm"],
-                "timestamp": datetime.now().isoformat()
-            }
+            progress_update = {"type": "progress_update", **progress_fields}
             
             try:
-                # Envoyer sur les deux canaux
-                await manager.broadcast(status_update, "evaluation_status")
-                await manager.broadcast(progress_update, "progress_updates")
+                # Envoyer sur les deux canaux en parallèle
+                await asyncio.gather(
+                    manager.broadcast(status_update, "evaluation_status"),
+                    manager.broadcast(progress_update, "progress_updates")
+                )
             except Exception as e:
                 logger.warning(f"Non-critical: Error updating evaluation status: {str(e)}")
     
@@ -420,22 +735,74 @@ class LLMEvaluationService:
             evaluation_id: ID de l'évaluation
         """
         if evaluation_id in self.evaluations:
-            eval_meta_path = self.frontend_data_dir / f"evaluation_{evaluation_id}.json"
-            safe_eval_info = self.evaluations[evaluation_id].copy()
-            
-            # Supprimer les chemins complets pour la sécurité
-            if "document_paths" in safe_eval_info:
-                safe_eval_info.pop("document_paths")
+            # Pas de verrou : l'instantané est pris et mis en file sans point d'attente,
+            # et la file d'écriture garde le dernier contenu par chemin, donc la dernière
+            # sauvegarde reflète toujours l'état le plus récent. Les sauvegardes de
+            # plusieurs évaluations peuvent ainsi partager un même lot.
+            self._dirty_evals.discard(evaluation_id)
+            eval_meta_path = self._evaluation_meta_fmt.format(evaluation_id)
+            safe_eval_info = self._evaluation_summary(self.evaluations[evaluation_id])
             
             await self._save_json_file(eval_meta_path, safe_eval_info)
+            self._notify_change()
             
             logger.info(f"Saved evaluation metadata for {evaluation_id}")
     
+    def _notify_change(self) -> None:
+        """
+        Signale une modification des évaluations ou des rapports à l'appelant
+        """
+        if self._on_change is not None:
+            self._on_change()
+    
+    @staticmethod
+    def _evaluation_summary(eval_info: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Projette une évaluation sur ses champs publics. Les chemins complets sont
+        exclus pour la sécurité et les QCM sont conservés dans le fichier annexe .qcm.jsonl
+        
+        Args:
+            eval_info: Évaluation en mémoire
+            
+        Returns:
+            Dict[str, Any]: Nouveau dictionnaire restreint à _EVAL_SUMMARY_KEYS
+        """
+        summary = {key: eval_info[key] for key in _EVAL_SUMMARY_KEYS if key in eval_info}
+        summary["qcm_count"] = eval_info.get("completed_qcm", 0)
+        return summary
+    
+    def _mark_evaluation_dirty(self, evaluation_id: str) -> None:
+        """
+        Planifie une écriture différée des métadonnées d'une évaluation
+        
+        Args:
+            evaluation_id: ID de l'évaluation
+        """
+        self._dirty_evals.add(evaluation_id)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_dirty_evaluations())
+    
+    async def _flush_dirty_evaluations(self) -> None:
+        """
+        Écrit périodiquement les évaluations modifiées, tant qu'il en reste
+        """
+        while self._dirty_evals:
+            await asyncio.sleep(EVAL_FLUSH_INTERVAL)
+            for evaluation_id in list(self._dirty_evals):
+                try:
+                    await self._save_evaluation_metadata(evaluation_id)
+                except Exception as e:
+                    logger.error(f"Error flushing evaluation metadata {evaluation_id}: {str(e)}")
+                    self._dirty_evals.discard(evaluation_id)
+    
     async def _generate_qcm_with_updates(self, evaluation_id: str, context: str, 
                                   test_mode: bool, manager, selected_criteria: List[str] = None) -> List[Dict[str, Any]]:
         """
         Génère les QCM avec des mises à jour en temps réel via WebSocket
         """
+        # Fichier annexe où chaque QCM est ajouté (une ligne JSON par QCM)
+        # Sans tampon : chaque ligne écrite est visible aussitôt par get_evaluation_qcm
+        qcm_file = await aiofiles.open(self._qcm_file_path(evaluation_id), "wb", buffering=0)
         try:
             # Initialiser la liste des QCM
             qcm_list = []
@@ -459,6 +826,33 @@ class LLMEvaluationService:
             # Paramètres de génération
             num_generic = 5 if test_mode else 30
             qcm_counter = 0
+            
+            # QCM en attente de diffusion
+            pending: List[Dict[str, Any]] = []
+            last_flush = time.monotonic()
+            
+            async def flush_pending():
+                nonlocal last_flush
+                if not pending:
+                    return
+                # Un seul horodatage pour le lot et la mise à jour de statut
+                timestamp = datetime.now().isoformat()
+                try:
+                    await manager.broadcast({
+                        "type": "qcm_batch",
+                        "evaluation_id": evaluation_id,
+                        "items": list(pending),
+                        "progress": (qcm_counter / total_qcm) * 100,
+                        "timestamp": timestamp
+                    }, "qcm_updates")
+                except Exception as e:
+                    logger.warning(f"Non-critical: Error broadcasting QCM update: {str(e)}")
+                pending.clear()
+                last_flush = time.monotonic()
+                
+                # Mettre à jour le statut une fois par lot
+                await self._update_evaluation_status(evaluation_id, manager, timestamp)
+                self._mark_evaluation_dirty(evaluation_id)
                 
             # Fonction pour traiter un QCM et mettre à jour la progression
             async def process_qcm(qcm):
@@ -469,7 +863,7 @@ class LLMEvaluationService:
                 
                 # Ajouter le QCM à la liste
                 qcm_list.append(qcm)
-                self.evaluations[evaluation_id]["qcm_list"].append(qcm)
+                await qcm_file.write(_json_dumps(qcm) + b"\n")
                 self.evaluations[evaluation_id]["completed_qcm"] += 1
                 
                 # Incrémenter le compteur et calculer la progression
@@ -477,23 +871,10 @@ class LLMEvaluationService:
                 progress = (qcm_counter / total_qcm) * 100
                 self.evaluations[evaluation_id]["progress"] = min(progress, 99.0)
                 
-                # Diffuser la mise à jour
-                try:
-                    await manager.broadcast({
-                        "type": "qcm_generated",
-                        "evaluation_id": evaluation_id,
-                        "qcm": qcm,
-                        "progress": progress,
-                        "timestamp": datetime.now().isoformat()
-                    }, "qcm_updates")
-                except Exception as e:
-                    logger.warning(f"Non-critical: Error broadcasting QCM update: {str(e)}")
-                
-                # Mettre à jour le statut
-                await self._update_evaluation_status(evaluation_id, manager)
-                
-                # Pause courte pour permettre l'interaction avec l'interface
-                await asyncio.sleep(0.1)
+                # Diffuser les QCM par lots plutôt qu'un message par QCM
+                pending.append(qcm)
+                if len(pending) >= QCM_BATCH_SIZE or time.monotonic() - last_flush > QCM_BATCH_INTERVAL:
+                    await flush_pending()
                 
             # Générer et traiter les QCM de manière asynchrone
             if not selected_criteria:
@@ -531,14 +912,16 @@ class LLMEvaluationService:
                                 if qcm:
                                     await process_qcm(qcm)
             
-            # Mettre à jour les métadonnées
-            await self._save_evaluation_metadata(evaluation_id)
+            # Diffuser les derniers QCM en attente
+            await flush_pending()
             
             return qcm_list
             
         except Exception as e:
             logger.error(f"Error generating QCM: {str(e)}")
             raise
+        finally:
+            await qcm_file.close()
 
     async def _generate_single_qcm(self, context: str, params: Dict = None, test_mode: bool = False) -> Dict[str, Any]:
         """
@@ -637,12 +1020,18 @@ class LLMEvaluationService:
             evaluations = []
             
             # Chercher tous les fichiers de métadonnées d'évaluations
-            meta_files = list(self.frontend_data_dir.glob("evaluation_*.json"))
+            meta_files = self._scan_meta_files("evaluation_")
             
-            for meta_file in meta_files:
+            # Lire toutes les métadonnées en parallèle, hors de la boucle d'événements
+            infos = await asyncio.gather(
+                *(self._read_meta_cached(entry) for entry in meta_files),
+                return_exceptions=True
+            )
+            
+            for meta_file, evaluation_info in zip(meta_files, infos):
                 try:
-                    with open(meta_file, "r", encoding="utf-8") as f:
-                        evaluation_info = json.load(f)
+                    if isinstance(evaluation_info, Exception):
+                        raise evaluation_info
                     
                     # Exclure la liste des QCM pour alléger les données
                     if "qcm_list" in evaluation_info:
@@ -651,7 +1040,7 @@ class LLMEvaluationService:
                     
                     evaluations.append(evaluation_info)
                 except Exception as e:
-                    logger.error(f"Error reading evaluation metadata {meta_file}: {str(e)}")
+                    logger.error(f"Error reading evaluation metadata {meta_file.path}: {str(e)}")
             
             # Trier les évaluations par date de début (du plus récent au plus ancien)
             evaluations.sort(key=lambda x: x.get("start_time", ""), reverse=True)
@@ -662,12 +1051,13 @@ class LLMEvaluationService:
             logger.error(f"Error getting evaluations: {str(e)}")
             raise
     
-    async def get_evaluation(self, evaluation_id: str) -> Optional[Dict[str, Any]]:
+    async def get_evaluation(self, evaluation_id: str, include_qcm: bool = False) -> Optional[Dict[str, Any]]:
         """
         Récupère les informations d'une évaluation spécifique
         
         Args:
             evaluation_id: ID de l'évaluation
+            include_qcm: Ajouter la liste complète des QCM (qcm_list)
             
         Returns:
             Optional[Dict[str, Any]]: Informations sur l'évaluation ou None si elle n'existe pas
@@ -675,17 +1065,24 @@ class LLMEvaluationService:
         try:
             # D'abord vérifier si l'évaluation est en mémoire (en cours)
             if evaluation_id in self.evaluations:
-                # Retourner une copie pour éviter la modification des données en mémoire
-                return self.evaluations[evaluation_id].copy()
-            
-            # Sinon, chercher dans les fichiers
-            meta_path = self.frontend_data_dir / f"evaluation_{evaluation_id}.json"
-            
-            if not meta_path.exists():
-                return None
+                # Projection des champs utiles plutôt qu'une copie complète
+                evaluation_info = self._evaluation_summary(self.evaluations[evaluation_id])
+            else:
+                # Sinon, chercher dans les fichiers
+                meta_path = self._evaluation_meta_fmt.format(evaluation_id)
+                
+                if not os.path.exists(meta_path):
+                    return None
+                    
+                evaluation_info = await self._read_meta_cached(meta_path)
                 
-            with open(meta_path, "r", encoding="utf-8") as f:
-                evaluation_info = json.load(f)
+                # Anciennes évaluations : QCM stockés dans les métadonnées
+                legacy_qcm = evaluation_info.pop("qcm_list", None)
+                if include_qcm and legacy_qcm is not None:
+                    evaluation_info["qcm_list"] = legacy_qcm
+            
+            if include_qcm and "qcm_list" not in evaluation_info:
+                evaluation_info["qcm_list"] = await self.get_evaluation_qcm(evaluation_id) or []
                 
             return evaluation_info
             
@@ -704,18 +1101,21 @@ class LLMEvaluationService:
             Optional[List[Dict[str, Any]]]: Liste des QCM ou None si non trouvée
         """
         try:
-            # D'abord vérifier si l'évaluation est en mémoire (en cours)
+            # Les QCM ne sont conservés que dans le fichier annexe, y compris en cours d'évaluation
+            qcm_path = self._qcm_file_path(evaluation_id)
+            if qcm_path.exists():
+                return await self._to_io(self._read_qcm_file, qcm_path)
+            
             if evaluation_id in self.evaluations:
-                return self.evaluations[evaluation_id]["qcm_list"]
+                return []
             
-            # Sinon, chercher dans les fichiers
-            meta_path = self.frontend_data_dir / f"evaluation_{evaluation_id}.json"
+            meta_path = self._evaluation_meta_fmt.format(evaluation_id)
             
-            if not meta_path.exists():
+            if not os.path.exists(meta_path):
                 return None
-                
-            with open(meta_path, "r", encoding="utf-8") as f:
-                evaluation_info = json.load(f)
+            
+            # Anciennes évaluations : QCM stockés dans les métadonnées
+            evaluation_info = await self._read_meta_cached(meta_path)
                 
             return evaluation_info.get("qcm_list", [])
             
@@ -723,65 +1123,85 @@ class LLMEvaluationService:
             logger.error(f"Error getting QCM for evaluation {evaluation_id}: {str(e)}")
             raise
     
-    async def generate_reports(self, evaluation_id: str, evaluation_results: Dict[str, Any] = None) -> Dict[str, str]:
+    def _qcm_file_path(self, evaluation_id: str) -> Path:
+        """
+        Chemin du fichier annexe contenant les QCM d'une évaluation
+        
+        Args:
+            evaluation_id: ID de l'évaluation
+            
+        Returns:
+            Path: Chemin du fichier .qcm.jsonl
+        """
+        return self.frontend_data_dir / f"evaluation_{evaluation_id}.qcm.jsonl"
+    
+    @staticmethod
+    def _read_qcm_file(qcm_path: Path) -> List[Dict[str, Any]]:
+        """
+        Lit un fichier annexe de QCM ligne par ligne
+        
+        Args:
+            qcm_path: Chemin du fichier .qcm.jsonl
+            
+        Returns:
+            List[Dict[str, Any]]: Liste des QCM
+        """
+        with open(qcm_path, "rb") as f:
+            # Une dernière ligne sans saut de ligne est en cours d'écriture : l'ignorer
+            return [_json_loads(line) for line in f if line.endswith(b"\n") and line.strip()]
+    
+    async def generate_reports(self, evaluation_id: str, evaluation_results: Dict[str, Any] = None,
+                               formats: Tuple[str, ...] = REPORT_FORMATS) -> Dict[str, str]:
         """
         Génère les rapports pour une évaluation
         
         Args:
             evaluation_id: ID de l'évaluation
             evaluation_results: Résultats de l'évaluation (optionnel)
+            formats: Formats à écrire tout de suite ; le JSON est toujours écrit car
+                les autres formats peuvent être générés plus tard à partir de lui
             
         Returns:
-            Dict[str, str]: Chemins des rapports générés
+            Dict[str, str]: Chemins des rapports (y compris ceux générés à la demande)
         """
         try:
             # Si les résultats ne sont pas fournis, récupérer l'évaluation
             if evaluation_results is None:
-                evaluation = await self.get_evaluation(evaluation_id)
+                evaluation = await self.get_evaluation(evaluation_id, include_qcm=True)
                 if not evaluation:
                     raise ValueError(f"Evaluation {evaluation_id} not found")
                 evaluation_results = evaluation.get("results", {})
             else:
-                evaluation = await self.get_evaluation(evaluation_id)
+                evaluation = await self.get_evaluation(evaluation_id, include_qcm=True)
                 if not evaluation:
                     raise ValueError(f"Evaluation {evaluation_id} not found")
             
-            # Structure pour stocker les chemins des rapports
-            report_paths = {}
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             
             # Créer un ID unique pour ce groupe de rapports
             report_group_id = str(uuid.uuid4())
             
             # Informations sur les documents liés à cette évaluation
-            eval_documents = []
-            for doc_id in evaluation.get("documents", []):
-                doc_info = await self.get_document(doc_id)
-                if doc_info:
-                    eval_documents.append({
-                        "id": doc_id,
-                        "name": doc_info.get("original_name", "Unknown")
-                    })
-            
-            # Générer le rapport HTML
-            html_path = self.frontend_reports_dir / f"report_{evaluation_id}_{timestamp}.html"
-            with open(html_path, "w", encoding="utf-8") as f:
-                f.write(self._generate_html_report(evaluation, evaluation_results))
-            report_paths["html"] = str(html_path)
-            
-            # Générer le rapport JSON
-            json_path = self.frontend_reports_dir / f"report_{evaluation_id}_{timestamp}.json"
-            with open(json_path, "w", encoding="utf-8") as f:
-                json.dump({
-                    "evaluation": evaluation,
-                    "results": evaluation_results
-                }, f, ensure_ascii=False, indent=4, sort_keys=True)
-            report_paths["json"] = str(json_path)
-            
-            # Générer le rapport CSV avec les QCM
-            csv_path = self.frontend_reports_dir / f"report_{evaluation_id}_{timestamp}.csv"
-            self._generate_csv_report(evaluation, evaluation_results, csv_path)
-            report_paths["csv"] = str(csv_path)
+            doc_ids = evaluation.get("documents", [])
+            doc_infos = await asyncio.gather(*(self.get_document(doc_id) for doc_id in doc_ids))
+            eval_documents = [
+                {"id": doc_id, "name": doc_info.get("original_name", "Unknown")}
+                for doc_id, doc_info in zip(doc_ids, doc_infos)
+                if doc_info
+            ]
+            
+            paths = {
+                fmt: self.frontend_reports_dir / f"report_{evaluation_id}_{timestamp}.{fmt}"
+                for fmt in REPORT_FORMATS
+            }
+            
+            # Générer les rapports demandés en un seul passage hors de la boucle d'événements
+            await self._to_io(
+                self._write_report_files,
+                evaluation, evaluation_results,
+                {fmt: path for fmt, path in paths.items() if fmt in formats or fmt == "json"}
+            )
+            report_paths = {fmt: str(path) for fmt, path in paths.items()}
             
             # Enregistrer les métadonnées du rapport
             report_meta = {
@@ -797,65 +1217,116 @@ class LLMEvaluationService:
             }
             
             # Sauvegarder les métadonnées du rapport
-            report_meta_path = self.frontend_data_dir / f"report_{report_group_id}.json"
+            report_meta_path = self._report_meta_fmt.format(report_group_id)
             await self._save_json_file(report_meta_path, report_meta)
+            await self._add_to_reports_index(report_meta)
             
             return report_paths
         except Exception as e:
             logger.error(f"Error generating reports: {str(e)}")
             raise
         
-    def _generate_csv_report(self, evaluation: Dict, results: Dict, csv_path: Path) -> None:
+    def _write_report_files(self, evaluation: Dict, results: Dict, paths: Dict[str, Path]) -> None:
         """
-        Génère un rapport CSV avec les résultats des QCM
+        Écrit les rapports d'une évaluation dans les formats demandés
         
         Args:
             evaluation: Données de l'évaluation
             results: Résultats de l'évaluation
+            paths: Chemin de destination par format (html, json, csv)
+        """
+        details = results.get("details", [])
+        
+        # Rapport HTML
+        if "html" in paths:
+            criteria_rows = [
+                (
+                    criterion,
+                    (stats.get("score", 0) / stats["total"]) * 100 if stats.get("total", 0) > 0 else 0,
+                    stats.get("success_count", 0),
+                    stats.get("questions_count", 0)
+                )
+                for criterion, stats in results.get("criteria_scores", {}).items()
+            ]
+            with open(paths["html"], "w", encoding="utf-8") as f:
+                f.writelines(self._generate_html_report(evaluation, results, criteria_rows, details))
+        
+        # Rapport JSON (compact : il n'est lu que par programme)
+        if "json" in paths:
+            paths["json"].write_bytes(_json_dumps({
+                "evaluation": evaluation,
+                "results": results
+            }))
+        
+        # Rapport CSV avec les QCM
+        if "csv" in paths:
+            results_by_q = {detail.get("question", ""): detail for detail in details}
+            self._generate_csv_report(evaluation, results_by_q, paths["csv"])
+    
+    def _render_report_from_json(self, json_path: str, format: str, file_path: str) -> None:
+        """
+        Génère un format de rapport à partir du rapport JSON déjà écrit, dans un
+        fichier temporaire mis en place par os.replace : le fichier final est complet ou absent
+        
+        Args:
+            json_path: Chemin du rapport JSON
+            format: Format à générer (html ou csv)
+            file_path: Chemin du fichier à écrire
+        """
+        with open(json_path, "rb") as f:
+            data = _json_loads(f.read())
+        
+        file_path = Path(file_path)
+        tmp_path = file_path.with_name(f"{file_path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            self._write_report_files(data["evaluation"], data["results"], {format: tmp_path})
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+    
+    def _generate_csv_report(self, evaluation: Dict, results_by_q: Dict[str, Dict], csv_path: Path) -> None:
+        """
+        Génère un rapport CSV avec les résultats des QCM
+        
+        Args:
+            evaluation: Données de l'évaluation
+            results_by_q: Détails des résultats indexés par question
             csv_path: Chemin du fichier CSV à générer
         """
         import csv
         
         try:
             qcm_list = evaluation.get("qcm_list", [])
-            details = results.get("details", [])
             
-            # Créer un dictionnaire de résultats pour un accès facile
-            results_dict = {}
-            for detail in details:
-                question = detail.get("question", "")
-                results_dict[question] = detail
+            def build_row(qcm: Dict) -> List[Any]:
+                question = qcm.get("question", "")
+                result = results_by_q.get(question, {})
+                choices = qcm.get("choices") or {}
+                return [
+                    qcm.get("criterion", ""),
+                    qcm.get("type", ""),
+                    qcm.get("difficulty", ""),
+                    question,
+                    choices.get("A", ""),
+                    choices.get("B", ""),
+                    choices.get("C", ""),
+                    choices.get("D", ""),
+                    qcm.get("correct_answer", ""),
+                    result.get("model_answer", ""),
+                    result.get("score", 0)
+                ]
             
             with open(csv_path, "w", newline="", encoding="utf-8") as csvfile:
                 writer = csv.writer(csvfile)
                 
-                # Écrire l'en-tête
+                # Écrire l'en-tête puis toutes les lignes en un seul appel
                 writer.writerow([
                     "Critère", "Type", "Difficulté", "Question", 
                     "Réponse A", "Réponse B", "Réponse C", "Réponse D", 
                     "Réponse Correcte", "Réponse du Modèle", "Score"
                 ])
-                
-                # Écrire les données pour chaque QCM
-                for qcm in qcm_list:
-                    question = qcm.get("question", "")
-                    result = results_dict.get(question, {})
-                    
-                    row = [
-                        qcm.get("criterion", ""),
-                        qcm.get("type", ""),
-                        qcm.get("difficulty", ""),
-                        question,
-                        qcm.get("choices", {}).get("A", ""),
-                        qcm.get("choices", {}).get("B", ""),
-                        qcm.get("choices", {}).get("C", ""),
-                        qcm.get("choices", {}).get("D", ""),
-                        qcm.get("correct_answer", ""),
-                        result.get("model_answer", ""),
-                        result.get("score", 0)
-                    ]
-                    
-                    writer.writerow(row)
+                writer.writerows(map(build_row, qcm_list))
         except Exception as e:
             logger.error(f"Error generating CSV report: {str(e)}")
             # Créer un CSV minimal en cas d'erreur
@@ -863,122 +1334,34 @@ class LLMEvaluationService:
                 writer = csv.writer(csvfile)
                 writer.writerow(["Error generating report", str(e)])
     
-    def _generate_html_report(self, evaluation: Dict, results: Dict) -> str:
+    def _generate_html_report(self, evaluation: Dict, results: Dict,
+                              criteria_rows: List[Tuple[str, float, int, int]],
+                              details: List[Dict]) -> Iterator[str]:
         """
-        Génère le contenu HTML d'un rapport d'évaluation
+        Génère le contenu HTML d'un rapport d'évaluation, fragment par fragment
+        (les valeurs sont échappées par le gabarit)
         
         Args:
             evaluation: Données de l'évaluation
             results: Résultats de l'évaluation
+            criteria_rows: (critère, score en %, succès, total) pour chaque critère
+            details: Détails des résultats par QCM
             
         Returns:
-            str: Contenu HTML
-        """
-        eval_id = evaluation.get("id", "")
-        start_time = evaluation.get("start_time", "")
-        end_time = evaluation.get("end_time", "")
-        total_qcm = evaluation.get("completed_qcm", 0)
-        
-        total_score = results.get("total_score", 0)
-        success_rate = results.get("success_rate", 0)
-        criteria_scores = results.get("criteria_scores", {})
-        
-        # Construire une table pour les scores par critère
-        criteria_table = ""
-        for criterion, stats in criteria_scores.items():
-            score_pct = (stats.get("score", 0) / stats.get("total", 1)) * 100 if stats.get("total", 0) > 0 else 0
-            criteria_table += f"""
-            <tr>
-                <td>{criterion}</td>
-                <td>{score_pct:.1f}%</td>
-                <td>{stats.get("success_count", 0)}/{stats.get("questions_count", 0)}</td>
-            </tr>
-            """
-        
-        # Construire une table pour les QCM
-        qcm_table = ""
-        for detail in results.get("details", []):
-            qcm_table += f"""
-            <tr>
-                <td>{detail.get("criterion", "")}</td>
-                <td>{detail.get("question", "")}</td>
-                <td>{detail.get("correct_answer", "")}</td>
-                <td>{detail.get("model_answer", "")}</td>
-                <td>{detail.get("score", 0)}/{detail.get("max_points", 0)}</td>
-            </tr>
-            """
-        
-        # Générer le rapport complet
-        html = f"""
-        <!DOCTYPE html>
-        <html lang="fr">
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>Rapport d'Évaluation LLM</title>
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 20px; }}
-                h1, h2, h3 {{ color: #333; }}
-                table {{ border-collapse: collapse; width: 100%; margin-bottom: 20px; }}
-                th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
-                th {{ background-color: #f2f2f2; }}
-                .summary {{ margin: 20px 0; }}
-                .summary-item {{ margin-bottom: 10px; }}
-                .score {{font-weight: bold; color: #86bc24; }}
-            </style>
-        </head>
-        <body>
-            <h1>Rapport d'Évaluation LLM</h1>
-            
-            <div class="summary">
-                <h2>Résumé</h2>
-                <div class="summary-item"><strong>ID:</strong> {eval_id}</div>
-                <div class="summary-item"><strong>Date de début:</strong> {start_time}</div>
-                <div class="summary-item"><strong>Date de fin:</strong> {end_time}</div>
-                <div class="summary-item"><strong>Total QCM:</strong> {total_qcm}</div>
-                <div class="summary-item"><strong>Score global:</strong> <span class="score">{total_score:.1f}%</span></div>
-                <div class="summary-item"><strong>Taux de succès:</strong> {success_rate:.1f}%</div>
-            </div>
-            
-            <h2>Performance par Critère</h2>
-            <table>
-                <thead>
-                    <tr>
-                        <th>Critère</th>
-                        <th>Score (%)</th>
-                        <th>Succès/Total</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    {criteria_table}
-                </tbody>
-            </table>
-            
-            <h2>Détails des QCM</h2>
-            <table>
-                <thead>
-                    <tr>
-                        <th>Critère</th>
-                        <th>Question</th>
-                        <th>Réponse Correcte</th>
-                        <th>Réponse du Modèle</th>
-                        <th>Score</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    {qcm_table}
-                </tbody>
-            </table>
-        </body>
-        </html>
-        """
-        
-        return html
+            Iterator[str]: Fragments successifs du contenu HTML
+        """
+        return REPORT_HTML_TEMPLATE.generate(
+            evaluation=evaluation,
+            results=results,
+            criteria=criteria_rows,
+            details=details
+        )
     
     async def get_reports(self, evaluation_id: Optional[str] = None, 
                       document_id: Optional[str] = None,
                       date_from: Optional[str] = None, 
-                      date_to: Optional[str] = None) -> List[Dict[str, Any]]:
+                      date_to: Optional[str] = None,
+                      limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Récupère la liste des rapports disponibles avec filtrage
         
@@ -987,6 +1370,7 @@ class LLMEvaluationService:
             document_id: Filtrer par ID de document
             date_from: Filtrer par date à partir de (format ISO)
             date_to: Filtrer par date jusqu'à (format ISO)
+            limit: Nombre maximal de rapports (les plus récents)
             
         Returns:
             List[Dict[str, Any]]: Liste des rapports
@@ -994,39 +1378,37 @@ class LLMEvaluationService:
         try:
             reports = []
             
-            # Chercher tous les fichiers de métadonnées de rapports
-            meta_files = list(self.frontend_data_dir.glob("report_*.json"))
-            
-            for meta_file in meta_files:
-                try:
-                    with open(meta_file, "r", encoding="utf-8") as f:
-                        report_data = json.load(f)
+            # Normaliser les bornes une seule fois : les dates ISO (sans fuseau)
+            # se comparent ensuite directement comme des chaînes
+            if date_from:
+                date_from = datetime.fromisoformat(date_from).isoformat()
+            if date_to:
+                date_to = datetime.fromisoformat(date_to).isoformat()
+            
+            # Un seul fichier manifeste au lieu d'un fichier par rapport
+            for report_data in await self._load_reports_index():
+                # Appliquer les filtres
+                if evaluation_id and report_data.get("evaluation_id") != evaluation_id:
+                    continue
                     
-                    # Appliquer les filtres
-                    if evaluation_id and report_data.get("evaluation_id") != evaluation_id:
-                        continue
-                        
-                    if document_id and document_id not in report_data.get("document_ids", []):
-                        continue
-                        
-                    if date_from:
-                        report_date = datetime.fromisoformat(report_data.get("creation_date", ""))
-                        filter_date = datetime.fromisoformat(date_from)
-                        if report_date < filter_date:
-                            continue
-                            
-                    if date_to:
-                        report_date = datetime.fromisoformat(report_data.get("creation_date", ""))
-                        filter_date = datetime.fromisoformat(date_to)
-                        if report_date > filter_date:
-                            continue
+                if document_id and document_id not in report_data.get("document_ids", []):
+                    continue
                     
-                    reports.append(report_data)
-                except Exception as e:
-                    logger.error(f"Error reading report metadata {meta_file}: {str(e)}")
+                creation_date = report_data["creation_date"]
+                if date_from and creation_date < date_from:
+                    continue
+                        
+                if date_to and creation_date > date_to:
+                    continue
+                
+                # Copie : l'index en mémoire ne doit pas être modifié par l'appelant
+                reports.append(dict(report_data))
             
             # Trier les rapports par date (du plus récent au plus ancien)
-            reports.sort(key=lambda x: x.get("creation_date", ""), reverse=True)
+            by_date = itemgetter("creation_date")
+            if limit is not None and limit < len(reports):
+                return heapq.nlargest(limit, reports, key=by_date)
+            reports.sort(key=by_date, reverse=True)
             
             return reports
             
@@ -1034,34 +1416,193 @@ class LLMEvaluationService:
             logger.error(f"Error getting reports: {str(e)}")
             raise
     
-    async def get_report(self, report_id: str) -> Optional[Dict[str, Any]]:
+    async def _load_reports_index(self) -> List[Dict[str, Any]]:
+        """
+        Retourne le manifeste des rapports, rechargé seulement si le fichier a changé
+        
+        Returns:
+            List[Dict[str, Any]]: Métadonnées de tous les rapports
+        """
+        if self._reports_index_lock is None:
+            self._reports_index_lock = asyncio.Lock()
+        
+        # Lecture sans verrou de fichier : le manifeste n'est remplacé que par os.replace
+        async with self._reports_index_lock:
+            entries = await self._read_reports_index(force=False)
+        if entries is not None:
+            return entries
+        
+        # Manifeste absent : le reconstruire sous le verrou inter-processus
+        async with self._reports_index_guard():
+            return await self._load_reports_index_locked(force=False)
+    
+    @asynccontextmanager
+    async def _reports_index_guard(self):
+        """
+        Verrou du manifeste des rapports : asyncio.Lock pour ce processus et flock
+        sur un fichier voisin pour les autres workers
+        """
+        if self._reports_index_lock is None:
+            self._reports_index_lock = asyncio.Lock()
+        
+        async with self._reports_index_lock:
+            if fcntl is None:
+                yield
+                return
+            
+            lock_file = await self._to_io(open, self._reports_index_lock_path, "ab")
+            try:
+                await self._to_io(fcntl.flock, lock_file.fileno(), fcntl.LOCK_EX)
+                yield
+            finally:
+                # Fermer le fichier libère le flock
+                lock_file.close()
+    
+    async def _read_reports_index(self, force: bool) -> Optional[List[Dict[str, Any]]]:
+        """
+        Lit le manifeste des rapports s'il a changé depuis la dernière lecture
+        
+        Args:
+            force: Relire le fichier même si sa signature n'a pas changé
+            
+        Returns:
+            Optional[List[Dict[str, Any]]]: Métadonnées des rapports, None si le manifeste n'existe pas
+        """
+        try:
+            st = await self._to_io(os.stat, self.reports_index_path)
+        except FileNotFoundError:
+            return None
+        
+        # Chaque os.replace crée un nouvel inode : la signature change même si deux
+        # écritures tombent dans le même tick de mtime
+        version = (st.st_mtime_ns, st.st_size, st.st_ino)
+        if force or self._reports_index is None or version != self._reports_index_version:
+            self._reports_index = await self._load_json(self.reports_index_path)
+            self._reports_index_version = version
+        return self._reports_index
+    
+    async def _load_reports_index_locked(self, force: bool) -> List[Dict[str, Any]]:
+        """
+        Charge le manifeste des rapports (verrous déjà acquis), en le reconstruisant
+        à partir des fichiers report_*.json s'il n'existe pas encore
+        
+        Args:
+            force: Relire le fichier même si sa signature n'a pas changé
+            
+        Returns:
+            List[Dict[str, Any]]: Métadonnées de tous les rapports
+        """
+        entries = await self._read_reports_index(force)
+        if entries is None:
+            await self._write_reports_index(await self._scan_report_files())
+            entries = self._reports_index
+        return entries
+    
+    async def _add_to_reports_index(self, report_meta: Dict[str, Any]) -> None:
+        """
+        Ajoute (ou remplace) un rapport dans le manifeste et le réécrit de façon atomique
+        
+        Args:
+            report_meta: Métadonnées du rapport
+        """
+        async with self._reports_index_guard():
+            # Relire sous le verrou : un autre worker a pu ajouter un rapport entre-temps.
+            # Un manifeste tout juste reconstruit contient déjà ce rapport : remplacer par id
+            entries = [
+                entry for entry in await self._load_reports_index_locked(force=True)
+                if entry.get("id") != report_meta.get("id")
+            ]
+            entries.append(report_meta)
+            await self._write_reports_index(entries)
+        self._notify_change()
+    
+    async def _write_reports_index(self, entries: List[Dict[str, Any]]) -> None:
+        """
+        Écrit le manifeste des rapports via un fichier temporaire puis os.replace
+        
+        Args:
+            entries: Métadonnées de tous les rapports
+        """
+        payload = _json_dumps(entries)
+        index_path = self.reports_index_path
+        
+        def write_index():
+            # Nom temporaire unique : aucun autre écrivain ne peut le tronquer ou le renommer
+            tmp_path = index_path.with_name(f"{index_path.name}.{uuid.uuid4().hex}.tmp")
+            try:
+                tmp_path.write_bytes(payload)
+                os.replace(tmp_path, index_path)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
+            st = os.stat(index_path)
+            return st.st_mtime_ns, st.st_size, st.st_ino
+        
+        self._reports_index_version = await self._to_io(write_index)
+        self._reports_index = entries
+    
+    async def _scan_report_files(self) -> List[Dict[str, Any]]:
+        """
+        Lit tous les fichiers report_*.json (reconstruction du manifeste)
+        
+        Returns:
+            List[Dict[str, Any]]: Métadonnées des rapports lisibles
+        """
+        meta_files = self._scan_meta_files("report_")
+        
+        # Lire toutes les métadonnées en parallèle, hors de la boucle d'événements
+        infos = await asyncio.gather(
+            *(self._read_meta_cached(meta_file) for meta_file in meta_files),
+            return_exceptions=True
+        )
+        
+        entries = []
+        for meta_file, report_data in zip(meta_files, infos):
+            if isinstance(report_data, Exception):
+                logger.error(f"Error reading report metadata {meta_file.path}: {str(report_data)}")
+                continue
+            report_data.setdefault("creation_date", "")
+            entries.append(report_data)
+        return entries
+    
+    async def get_report(self, report_id: str, load_content: bool = False) -> Optional[Dict[str, Any]]:
         """
         Récupère les informations d'un rapport spécifique
         
         Args:
             report_id: ID du rapport
+            load_content: Charger aussi le contenu HTML ("content") et JSON ("data")
             
         Returns:
-            Optional[Dict[str, Any]]: Informations sur le rapport ou None s'il n'existe pas
+            Optional[Dict[str, Any]]: Informations sur le rapport ou None s'il n'existe pas,
+                avec "existing_formats" (format -> chemin des fichiers présents sur disque)
         """
         try:
-            meta_path = self.frontend_data_dir / f"report_{report_id}.json"
+            meta_path = self._report_meta_fmt.format(report_id)
             
-            if not meta_path.exists():
+            try:
+                report_info = await self._read_meta_cached(meta_path)
+            except FileNotFoundError:
                 return None
-                
-            with open(meta_path, "r", encoding="utf-8") as f:
-                report_info = json.load(f)
-            
-            # Récupérer le contenu des fichiers de rapport
-            for format_type, file_path in report_info.get("report_files", {}).items():
-                if os.path.exists(file_path):
-                    if format_type == "html":
-                        with open(file_path, "r", encoding="utf-8") as f:
-                            report_info["content"] = f.read()
-                    elif format_type == "json":
-                        with open(file_path, "r", encoding="utf-8") as f:
-                            report_info["data"] = json.load(f)
+            
+            # Vérifier une seule fois la présence de chaque fichier de rapport
+            existing_formats = {
+                format_type: file_path
+                for format_type, file_path in report_info.get("report_files", {}).items()
+                if os.access(file_path, os.F_OK)
+            }
+            report_info["existing_formats"] = existing_formats
+            
+            if load_content:
+                # Lire en parallèle les fichiers des formats affichables
+                loads = {}
+                for format_type, file_path in existing_formats.items():
+                    loader = _REPORT_LOADERS.get(format_type)
+                    if loader:
+                        key, read = loader
+                        loads[key] = self._to_io(read, file_path)
+                contents = await asyncio.gather(*loads.values())
+                report_info.update(zip(loads, contents))
             
             return report_info
             
@@ -1069,7 +1610,8 @@ class LLMEvaluationService:
             logger.error(f"Error getting report {report_id}: {str(e)}")
             raise
     
-    async def download_report(self, report_id: str, format: str = "html") -> Optional[str]:
+    async def download_report(self, report_id: str,
+                              format: str = "html") -> Optional[Tuple[str, Dict[str, Any], os.stat_result]]:
         """
         Prépare un rapport pour le téléchargement
         
@@ -1078,7 +1620,9 @@ class LLMEvaluationService:
             format: Format du rapport (html, json, csv)
             
         Returns:
-            Optional[str]: Chemin du fichier à télécharger ou None s'il n'existe pas
+            Optional[Tuple[str, Dict[str, Any], os.stat_result]]: Chemin du fichier à
+                télécharger, métadonnées du rapport et stat du fichier (pris dans le pool
+                d'E/S), ou None s'il n'existe pas
         """
         try:
             report_info = await self.get_report(report_id)
@@ -1088,11 +1632,28 @@ class LLMEvaluationService:
             
             # Récupérer le chemin du fichier pour le format demandé
             file_path = report_info["report_files"].get(format)
-            
-            if not file_path or not os.path.exists(file_path):
+            if not file_path:
                 return None
             
-            return file_path
+            # Une génération en cours est attendue avant de faire confiance au disque
+            task = self._report_renders.get(file_path)
+            
+            if task is None and format not in report_info["existing_formats"]:
+                # Format non encore généré : le produire une seule fois à partir du JSON
+                json_path = report_info["existing_formats"].get("json")
+                if format == "json" or not json_path:
+                    return None
+                
+                task = asyncio.ensure_future(self._to_io(
+                    self._render_report_from_json, json_path, format, file_path
+                ))
+                self._report_renders[file_path] = task
+                task.add_done_callback(lambda _: self._report_renders.pop(file_path, None))
+            
+            if task is not None:
+                await asyncio.shield(task)
+            
+            return file_path, report_info, await self._to_io(os.stat, file_path)
             
         except Exception as e:
             logger.error(f"Error downloading report {report_id}: {str(e)}")
@@ -1105,25 +1666,48 @@ class LLMEvaluationService:
         Returns:
             Dict[str, Any]: Informations sur le LLM
         """
-        try:
-            # Ces informations seraient normalement extraites du backend
-            # Pour l'instant, nous retournons des valeurs statiques
-            return {
-                "model": "Gemini Pro",
-                "version": "2.0-flash",
-                "role": "Assistant Juridique",
-                "temperature": 0,
-                "max_tokens": 2048,
-                "description": "Modèle de langage optimisé pour l'évaluation des connaissances juridiques"
-            }
-            
-        except Exception as e:
-            logger.error(f"Error getting LLM info: {str(e)}")
-            raise
+        # Copie superficielle : l'appelant peut la modifier et la sérialiser librement
+        return dict(_LLM_INFO)
     
     async def get_llm_statistics(self) -> Dict[str, Any]:
         """
-        Récupère les statistiques de performance du LLM
+        Récupère les statistiques de performance du LLM, recalculées seulement
+        si une métadonnée d'évaluation a changé depuis le dernier calcul
+        
+        Returns:
+            Dict[str, Any]: Statistiques de performance
+        """
+        version = await self._to_io(self._evaluations_version)
+        if self._stats_cache is not None and self._stats_cache[0] == version:
+            stats = self._stats_cache[1]
+        else:
+            stats = await self._compute_llm_statistics()
+            self._stats_cache = (version, stats)
+        
+        # Copie : le résultat en cache ne doit pas être modifié par l'appelant
+        return {
+            **stats,
+            "criteria_scores": dict(stats["criteria_scores"]),
+            "success_examples": list(stats["success_examples"]),
+            "failure_examples": list(stats["failure_examples"])
+        }
+    
+    def _evaluations_version(self) -> frozenset:
+        """
+        Empreinte des métadonnées d'évaluations (nom, date de modification, taille)
+        
+        Returns:
+            frozenset: Empreinte, identique tant qu'aucun fichier n'a changé
+        """
+        return frozenset(
+            (entry.name, st.st_mtime_ns, st.st_size)
+            for entry in self._scan_meta_files("evaluation_")
+            for st in (entry.stat(),)
+        )
+    
+    async def _compute_llm_statistics(self) -> Dict[str, Any]:
+        """
+        Calcule les statistiques de performance du LLM à partir des évaluations complétées
         
         Returns:
             Dict[str, Any]: Statistiques de performance
@@ -1136,13 +1720,7 @@ class LLMEvaluationService:
             stats = {
                 "overall_score": 0,
                 "success_rate": 0,
-                "criteria_scores": {
-                    "Bias": 0,
-                    "Integrity": 0,
-                    "Relevance": 0,
-                    "Legal_Compliance": 0,
-                    "Coherence": 0
-                },
+                "criteria_scores": dict.fromkeys(STATS_CRITERIA, 0),
                 "total_evaluations": 0,
                 "total_qcm": 0,
                 "success_examples": [],
@@ -1156,49 +1734,85 @@ class LLMEvaluationService:
             if not completed_evaluations:
                 return stats
             
+            # Une ligne par évaluation : score global, taux de succès, puis un score par critère
+            # (les évaluations sans résultats gardent une ligne de zéros, comptée dans la moyenne)
+            rows = np.zeros((len(completed_evaluations), 2 + len(STATS_CRITERIA)), dtype=np.float64)
+            
+            # Les métadonnées lues par get_evaluations contiennent déjà les résultats :
+            # seules les évaluations sans nombre de QCM enregistré relisent leurs QCM
+            uncounted = [
+                evaluation["id"] for evaluation in completed_evaluations
+                if "results" in evaluation
+                and "total_qcm" not in evaluation["results"] and "qcm_count" not in evaluation
+            ]
+            qcm_lists = await asyncio.gather(
+                *(self.get_evaluation_qcm(eval_id) for eval_id in uncounted), return_exceptions=True
+            )
+            legacy_counts = {
+                eval_id: len(qcm_list) if qcm_list else 0
+                for eval_id, qcm_list in zip(uncounted, qcm_lists)
+                if not isinstance(qcm_list, Exception)
+            }
+            
+            # Meilleurs succès sur l'ensemble des évaluations : tas borné de (score, -rang, détail),
+            # le rang départageant les égalités au profit du premier rencontré
+            success_heap: List[Tuple[Any, int, Dict[str, Any]]] = []
+            rank = 0
+            
+            # Accumulateurs locaux, reportés dans stats une fois la boucle terminée
+            total_qcm = 0
+            failure_examples = []
+            
             # Agréger les résultats
-            for eval_info in completed_evaluations:
-                eval_id = eval_info["id"]
-                evaluation = await self.get_evaluation(eval_id)
-                
-                if not evaluation or "results" not in evaluation:
+            for row, evaluation in zip(rows, completed_evaluations):
+                if "results" not in evaluation:
                     continue
                 
                 results = evaluation["results"]
                 
-                # Agréger le score global
-                stats["overall_score"] += results.get("total_score", 0)
-                
-                # Agréger le taux de succès
-                stats["success_rate"] += results.get("success_rate", 0)
+                # Score global et taux de succès
+                row[0] = results.get("total_score", 0)
+                row[1] = results.get("success_rate", 0)
                 
-                # Agréger les scores par critère
+                # Scores par critère
                 for criterion, criterion_stats in results.get("criteria_scores", {}).items():
-                    if criterion in stats["criteria_scores"]:
-                        stats["criteria_scores"][criterion] += criterion_stats.get("score", 0) / criterion_stats.get("total", 1) * 100
+                    col = _CRITERIA_COLUMNS.get(criterion)
+                    if col is not None:
+                        row[col] = criterion_stats.get("score", 0) / criterion_stats.get("total", 1) * 100
                 
-                # Compter le nombre total de QCM
-                qcm_list = await self.get_evaluation_qcm(eval_id)
-                stats["total_qcm"] += len(qcm_list) if qcm_list else 0
-                
-                # Collecter quelques exemples de succès et d'échec
-                if len(stats["success_examples"]) < 3 and "details" in results:
-                    success_examples = [d for d in results["details"] if d.get("score", 0) > 0]
-                    if success_examples:
-                        stats["success_examples"].append(success_examples[0])
-                
-                if len(stats["failure_examples"]) < 3 and "details" in results:
-                    failure_examples = [d for d in results["details"] if d.get("score", 0) == 0]
-                    if failure_examples:
-                        stats["failure_examples"].append(failure_examples[0])
-            
-            # Calculer les moyennes
-            if stats["total_evaluations"] > 0:
-                stats["overall_score"] /= stats["total_evaluations"]
-                stats["success_rate"] /= stats["total_evaluations"]
+                # Compter le nombre total de QCM (enregistré à la fin de l'évaluation)
+                if "total_qcm" in results:
+                    total_qcm += results["total_qcm"]
+                elif "qcm_count" in evaluation:
+                    total_qcm += evaluation["qcm_count"]
+                else:
+                    total_qcm += legacy_counts.get(evaluation["id"], 0)
                 
-                for criterion in stats["criteria_scores"]:
-                    stats["criteria_scores"][criterion] /= stats["total_evaluations"]
+                # Collecter les exemples en un seul parcours des détails : les 3 meilleurs
+                # succès (tas borné) et le premier échec de chaque évaluation (3 au plus)
+                need_failure = len(failure_examples) < 3
+                for detail in results.get("details", ()):
+                    score = detail.get("score", 0)
+                    if score > 0:
+                        rank += 1
+                        entry = (score, -rank, detail)
+                        if len(success_heap) < 3:
+                            heapq.heappush(success_heap, entry)
+                        elif entry > success_heap[0]:
+                            heapq.heapreplace(success_heap, entry)
+                    elif score == 0 and need_failure:
+                        failure_examples.append(detail)
+                        need_failure = False
+            
+            stats["total_qcm"] = total_qcm
+            stats["success_examples"] = [detail for _, _, detail in sorted(success_heap, reverse=True)]
+            stats["failure_examples"] = failure_examples
+            
+            # Calculer les moyennes en une seule réduction
+            means = rows.mean(axis=0).tolist()
+            stats["overall_score"] = means[0]
+            stats["success_rate"] = means[1]
+            stats["criteria_scores"] = dict(zip(STATS_CRITERIA, means[2:]))
             
             return stats
             
@@ -1206,20 +1820,158 @@ class LLMEvaluationService:
             logger.error(f"Error getting LLM statistics: {str(e)}")
             raise
     
-    async def _save_json_file(self, file_path: Path, data: Dict) -> None:
+    async def _to_io(self, fn, *args):
+        """
+        Exécute une fonction bloquante d'accès fichier dans le pool dédié
+        
+        Args:
+            fn: Fonction à exécuter
+            *args: Arguments de la fonction
+            
+        Returns:
+            Le résultat de la fonction
+        """
+        return await asyncio.get_running_loop().run_in_executor(self._io_pool, fn, *args)
+    
+    def close(self) -> None:
+        """Libère le pool de threads des accès fichiers"""
+        self._io_pool.shutdown(wait=True)
+    
+    async def _load_json(self, file_path: Path) -> Any:
         """
-        Sauvegarde des données au format JSON de façon asynchrone
+        Charge un fichier JSON sans bloquer la boucle d'événements
+        
+        Args:
+            file_path: Chemin du fichier
+            
+        Returns:
+            Any: Données chargées
+        """
+        return _json_loads(await self._to_io(Path(file_path).read_bytes))
+    
+    def _scan_meta_files(self, prefix: str, directory: Optional[Path] = None) -> List[os.DirEntry]:
+        """
+        Liste les fichiers de métadonnées JSON commençant par un préfixe
+        en un seul parcours du répertoire
+        
+        Args:
+            prefix: Préfixe des noms de fichiers (ex: "evaluation_")
+            directory: Répertoire à parcourir (par défaut le répertoire des données frontend)
+            
+        Returns:
+            List[os.DirEntry]: Entrées correspondantes
+        """
+        with os.scandir(directory or self.frontend_data_dir) as entries:
+            return [e for e in entries if e.name.startswith(prefix) and e.name.endswith(".json")]
+    
+    async def _read_meta_cached(self, file_path: Union[str, Path, os.DirEntry]) -> Dict[str, Any]:
+        """
+        Charge un fichier de métadonnées en passant par le cache LRU,
+        invalidé dès que la date de modification ou la taille change
+        
+        Args:
+            file_path: Chemin du fichier, ou entrée issue de os.scandir (son stat est réutilisé)
+            
+        Returns:
+            Dict[str, Any]: Copie des métadonnées (les appelants ne modifient que les clés de premier niveau)
+        """
+        if isinstance(file_path, os.DirEntry):
+            key = file_path.path
+            st = file_path.stat()
+        else:
+            key = str(file_path)
+            st = os.stat(key)
+        cached = self._meta_cache.get(key)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            self._meta_cache.move_to_end(key)
+            return dict(cached[2])
+        
+        data = await self._load_json(key)
+        self._meta_cache[key] = (st.st_mtime_ns, st.st_size, data)
+        self._meta_cache.move_to_end(key)
+        if len(self._meta_cache) > META_CACHE_MAX:
+            self._meta_cache.popitem(last=False)
+        return dict(data)
+    
+    async def _save_json_file(self, file_path: Union[str, Path], data: Dict) -> None:
+        """
+        Sauvegarde des données au format JSON de façon asynchrone et atomique.
+        Les sauvegardes rapprochées sont regroupées en un lot (une seule écriture
+        par fichier, un seul fsync par répertoire) ; retourne une fois le lot écrit.
         
         Args:
             file_path: Chemin du fichier
             data: Données à sauvegarder
         """
-        def write_json():
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=4, sort_keys=True)
+        self._meta_cache.pop(str(file_path), None)
         
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, write_json)
+        # Sérialiser dans la boucle : l'instantané ne peut plus être modifié pendant l'écriture
+        file_path = Path(file_path)
+        self._pending_writes[file_path] = _json_dumps(data, pretty=True)
+        
+        waiter = asyncio.get_running_loop().create_future()
+        self._pending_waiters.setdefault(file_path, []).append(waiter)
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = asyncio.create_task(self._flush_pending_writes())
+        await waiter
+    
+    async def _flush_pending_writes(self) -> None:
+        """
+        Écrit les sauvegardes en attente par lots, tant qu'il en reste
+        """
+        while self._pending_writes:
+            await asyncio.sleep(WRITE_COALESCE_DELAY)
+            writes, self._pending_writes = self._pending_writes, {}
+            waiters, self._pending_waiters = self._pending_waiters, {}
+            
+            try:
+                errors = await self._to_io(self._write_json_batch, writes)
+            except Exception as e:
+                errors = {path: e for path in writes}
+            
+            for path, path_waiters in waiters.items():
+                for waiter in path_waiters:
+                    if waiter.done():
+                        continue
+                    if path in errors:
+                        waiter.set_exception(errors[path])
+                    else:
+                        waiter.set_result(None)
+    
+    @staticmethod
+    def _write_json_batch(writes: Dict[Path, bytes]) -> Dict[Path, Exception]:
+        """
+        Écrit un lot de fichiers (fichier temporaire puis os.replace), puis
+        synchronise une fois chaque répertoire concerné
+        
+        Args:
+            writes: Contenu à écrire par chemin
+            
+        Returns:
+            Dict[Path, Exception]: Erreurs rencontrées par chemin
+        """
+        errors = {}
+        for file_path, payload in writes.items():
+            tmp_path = file_path.with_name(f"{file_path.name}.{uuid.uuid4().hex}.tmp")
+            try:
+                tmp_path.write_bytes(payload)
+                os.replace(tmp_path, file_path)
+            except Exception as e:
+                tmp_path.unlink(missing_ok=True)
+                errors[file_path] = e
+        
+        # Rendre les renommages durables : un fsync par répertoire pour tout le lot
+        if hasattr(os, "O_DIRECTORY"):
+            for directory in {file_path.parent for file_path in writes}:
+                try:
+                    fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+                    try:
+                        os.fsync(fd)
+                    finally:
+                        os.close(fd)
+                except OSError as e:
+                    logger.warning(f"Non-critical: Error syncing directory {directory}: {str(e)}")
+        return errors
 
     async def _evaluate_model_with_updates(self, evaluation_id: str, qcm_list: List[Dict[str, Any]], 
                                     advanced_criteria: List[str], manager) -> Dict[str, Any]:
@@ -1260,6 +2012,7 @@ class LLMEvaluationService:
                 
                 # Mettre à jour le statut
                 await self._update_evaluation_status(evaluation_id, manager)
+                self._mark_evaluation_dirty(evaluation_id)
                 
                 # Traiter le lot de manière asynchrone
                 batch_results = await self._process_evaluation_batch(batch, advanced_criteria)
@@ -1280,9 +2033,6 @@ class LLMEvaluationService:
                     }, "evaluation_status")  # Assurez-vous que c'est bien "evaluation_status"
                 except Exception as e:
                     logger.warning(f"Non-critical: Error broadcasting batch completion: {str(e)}")
-                
-                # Permettre aux autres tâches de s'exécuter (notamment la navigation)
-                await asyncio.sleep(0.2)
             
             # Calculer les métriques finales
             self._calculate_final_metrics(results, len(qcm_list))
@@ -1300,6 +2050,7 @@ class LLMEvaluationService:
             results (Dict): Résultats à finaliser
             total_qcm (int): Nombre total de QCM
         """
+        results['total_qcm'] = total_qcm
         successful_tests = total_qcm - results['error_count']
         results['success_rate'] = (successful_tests / total_qcm) * 100 if total_qcm > 0 else 0
 
@@ -1343,9 +2094,6 @@ class LLMEvaluationService:
                     batch_results['error_count'] += 1
                     batch_results['details'].append(standard_result)
                 
-                # Petite pause pour d'autres tâches
-                await asyncio.sleep(0.01)
-                
             except Exception as e:
                 logger.error(f"Error processing QCM: {str(e)}")
                 batch_results['error_count'] += 1
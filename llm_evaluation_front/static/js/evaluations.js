@@ -775,16 +775,26 @@ async function startNewEvaluation() {
      */
         // Dans evaluations.js
     function handleQcmUpdates(data) {
-        if (data.type !== 'qcm_generated' || !data.qcm) return;
-        
         // Vérifier si c'est l'évaluation courante
         if (data.evaluation_id !== currentEvaluationId) return;
         
+        if (data.type === 'qcm_batch' && Array.isArray(data.items)) {
+            data.items.forEach(addGeneratedQcm);
+        } else if (data.type === 'qcm_generated' && data.qcm) {
+            addGeneratedQcm(data.qcm);
+        }
+    }
+    
+    /**
+     * Ajoute un QCM généré en tête de liste
+     * @param {Object} qcm - QCM généré
+     */
+    function addGeneratedQcm(qcm) {
         // Masquer le message vide
         qcmEmptyEl.style.display = 'none';
         
         // Créer l'élément QCM
-        const qcmEl = createQcmElement(data.qcm);
+        const qcmEl = createQcmElement(qcm);
         
         // Ajouter au début de la liste avec animation d'apparition
         qcmEl.style.opacity = '0';
@@ -273,8 +273,8 @@ async function loadReport(reportId, format = 'html') {
             }
         });
         
-        // Charger le rapport
-        const response = await fetch(`/api/reports/${reportId}`);
+        // Charger le rapport (métadonnées seules, le fichier est téléchargé ensuite)
+        const response = await fetch(`/api/reports/${reportId}?content=false`);
         const report = await response.json();
         
         // Récupérer le chemin du fichier pour le format demandé